@@ -18,7 +18,7 @@ from collections.abc import Mapping
 
 from langchain_core.messages import HumanMessage
 
-from .config import online_evals_enabled
+from .config import eager_tasks_enabled, online_evals_enabled
 from .env import ensure_runtime_env_ready, project_dotenv_path, runtime_preflight, update_project_dotenv
 from .message_utils import extract_text_content as _extract_text_content
 from .researcher_subgraph import extract_research_from_messages
@@ -41,8 +41,8 @@ _PRIMARY_NODE_NAMES = {
     "final_report_generation",
 }
 
-_SEARCH_SOURCE_RE = re.compile(r"^\[Source\s+(\d+)\]", re.MULTILINE)
-_SEARCH_URL_RE = re.compile(r"^URL:\s*(.+)$", re.MULTILINE)
+# One multiline sweep tags each search-result line as a source header or a URL line.
+_SEARCH_SUMMARY_LINE_RE = re.compile(r"^(?:(?P<source>\[Source\s+\d+\])|URL:[ \t]*(?P<url>.+)$)", re.MULTILINE)
 _RECURSION_LIMIT_RE = re.compile(r"Recursion limit of (\d+) reached")
 _PLAN_CONFIRMATION_RE = re.compile(r"reply\s+[\"']?start[\"']?\s+.*(plan|research)", re.IGNORECASE)
 _RUN_RECURSION_LIMIT = 1000
@@ -127,7 +127,8 @@ def _clean_tool_failure_detail(detail: str) -> str:
         cleaned = cleaned[len("[Research unit failed:") :].strip()
     if cleaned.endswith("]"):
         cleaned = cleaned[:-1].strip()
-    cleaned = re.sub(r"For troubleshooting, visit:.*", "", cleaned, flags=re.DOTALL).strip()
+    # Drop the provider's troubleshooting footer (everything from the marker on) without a regex.
+    cleaned = cleaned.partition("For troubleshooting, visit:")[0].strip()
     return cleaned
 
 
@@ -164,18 +165,20 @@ def _parse_search_summary(raw: str) -> tuple[int, list[str]]:
     if "No relevant search results found" in raw:
         return 0, []
 
-    source_count = len(_SEARCH_SOURCE_RE.findall(raw))
-
-    domains: list[str] = []
-    for match in _SEARCH_URL_RE.finditer(raw):
-        url = match.group(1).strip()
+    source_count = 0
+    domains: dict[str, None] = {}
+    for match in _SEARCH_SUMMARY_LINE_RE.finditer(raw):
+        if match.lastgroup == "source":
+            source_count += 1
+            continue
+        url = match.group("url").strip()
         if not url or url == "N/A":
             continue
         domain = urlparse(url).netloc.lower()
-        if domain and domain not in domains:
-            domains.append(domain)
+        if domain:
+            domains.setdefault(domain)
 
-    return source_count, domains
+    return source_count, list(domains)
 
 
 def _format_domain_list(domains: list[str], max_items: int = 3) -> str:
@@ -328,15 +331,14 @@ class ProgressDisplay:
     def _active_research_context(self, checkpoint_ns: str | None) -> _ResearchUnitContext | None:
         if not checkpoint_ns:
             return None
-        matches = [
+        matches = (
             (section_ns, context)
             for section_ns, context in self._active_research.items()
             if checkpoint_ns.startswith(section_ns)
-        ]
-        if not matches:
-            return None
-        # Prefer the deepest active section.
-        return sorted(matches, key=lambda item: len(item[0]), reverse=True)[0][1]
+        )
+        # Prefer the deepest active section; max keeps the first of equal-depth matches, as the stable sort did.
+        deepest = max(matches, key=lambda item: len(item[0]), default=None)
+        return deepest[1] if deepest is not None else None
 
     def _tool_depth(self, checkpoint_ns: str | None) -> int:
         context = self._active_research_context(checkpoint_ns)
@@ -753,6 +755,17 @@ async def _run_with_progress(
     return final_output
 
 
+def _install_eager_task_factory() -> None:
+    """Let short tool/node tasks finish without a scheduler round-trip when opted in."""
+    eager_task_factory = getattr(asyncio, "eager_task_factory", None)  # Python 3.12+
+    if eager_task_factory is None or not eager_tasks_enabled():
+        return
+    loop = asyncio.get_running_loop()
+    # Leave any factory installed by an embedding application alone.
+    if loop.get_task_factory() is None:
+        loop.set_task_factory(eager_task_factory)
+
+
 async def run(
     query: str,
     thread_id: str | None = None,
@@ -763,6 +776,7 @@ async def run(
 ) -> dict[str, Any]:
     """Run a deep research query and return the agent result state."""
     ensure_runtime_env_ready()
+    _install_eager_task_factory()
 
     resolved_thread_id = (thread_id or "").strip() or _new_thread_id()
     payload_messages = list(prior_messages or [])
@@ -954,6 +968,7 @@ async def run_session(thread_id: str, *, quiet: bool = False, verbose: bool = Fa
     from .graph import build_app
 
     ensure_runtime_env_ready()
+    _install_eager_task_factory()
     app = build_app(checkpointer=MemorySaver())
     config = _thread_config(thread_id)
 
@@ -5,6 +5,7 @@ Provider configuration — LLMs and search tools.
 from __future__ import annotations
 
 import asyncio
+import functools
 import os
 from typing import Any, Literal, cast
 from urllib.parse import urlparse
@@ -21,6 +22,7 @@ DEFAULT_MAX_REACT_TOOL_CALLS = 40
 DEFAULT_MAX_CONCURRENT_RESEARCH_UNITS = 4
 DEFAULT_MAX_RESEARCHER_ITERATIONS = 60
 DEFAULT_ENABLE_RUNTIME_EVENT_LOGS = False
+DEFAULT_ENABLE_EAGER_TASKS = False
 DEFAULT_EVAL_MODEL = "openai:gpt-4.1-mini"
 DEFAULT_ENABLE_ONLINE_EVALS = False
 DEFAULT_OPENAI_USE_RESPONSES_API = True
@@ -30,6 +32,10 @@ DEFAULT_OPENAI_WEB_SEARCH_MODEL = "gpt-5"
 DEFAULT_OPENAI_WEB_SEARCH_CONTEXT_SIZE = "medium"
 SUPPORTED_OPENAI_WEB_SEARCH_CONTEXT_SIZES = ("low", "medium", "high")
 ModelRole = Literal["orchestrator", "subagent"]
+# Env families read by get_search_tool() and the provider clients it builds.
+_SEARCH_TOOL_ENV_PREFIXES = ("SEARCH_PROVIDER", "OPENAI_", "EXA_", "TAVILY_")
+# Credential and endpoint env entries that chat model clients read when init_chat_model builds them.
+_CHAT_MODEL_ENV_SUFFIXES = ("_API_KEY", "_API_BASE", "_BASE_URL", "_ENDPOINT", "_ORG_ID", "_ORGANIZATION")
 
 
 class SearchProviderConfigError(RuntimeError):
@@ -41,10 +47,15 @@ def _resolve_int_env(var_name: str, default: int, minimum: int = 1) -> int:
     raw_value = os.environ.get(var_name)
     if raw_value is None:
         return default
+    return _parse_int_setting(raw_value, default, minimum)
 
+
+# Env is still read on every call so overrides apply immediately; only parsing of a given raw value is memoized.
+@functools.lru_cache(maxsize=64)
+def _parse_int_setting(raw_value: str, default: int, minimum: int) -> int:
     try:
-        value = int(str(raw_value).strip())
-    except (TypeError, ValueError):
+        value = int(raw_value.strip())
+    except ValueError:
         return default
 
     if value < minimum:
@@ -56,7 +67,12 @@ def _resolve_bool_env(var_name: str, default: bool = False) -> bool:
     raw_value = os.environ.get(var_name)
     if raw_value is None:
         return default
-    return str(raw_value).strip().lower() in {"1", "true", "yes", "on"}
+    return _parse_bool_setting(raw_value)
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_bool_setting(raw_value: str) -> bool:
+    return raw_value.strip().lower() in {"1", "true", "yes", "on"}
 
 
 def get_max_structured_output_retries() -> int:
@@ -109,6 +125,11 @@ def runtime_event_logs_enabled() -> bool:
     return _resolve_bool_env("ENABLE_RUNTIME_EVENT_LOGS", DEFAULT_ENABLE_RUNTIME_EVENT_LOGS)
 
 
+def eager_tasks_enabled() -> bool:
+    """Return whether CLI runs should start asyncio tasks eagerly (Python 3.12+)."""
+    return _resolve_bool_env("ENABLE_EAGER_TASKS", DEFAULT_ENABLE_EAGER_TASKS)
+
+
 def online_evals_enabled() -> bool:
     """Return whether online LLM-as-judge evaluations are enabled."""
     return _resolve_bool_env("ENABLE_ONLINE_EVALS", DEFAULT_ENABLE_ONLINE_EVALS)
@@ -344,7 +365,7 @@ class _OpenAIResponsesWebSearchTool:
             return []
 
         citation_map = self._citation_metadata(output_items)
-        ordered_urls: list[str] = []
+        ordered_urls: dict[str, None] = {}
 
         for item in output_items:
             if self._field(item, "type", "") != "web_search_call":
@@ -359,12 +380,12 @@ class _OpenAIResponsesWebSearchTool:
                 if self._field(source, "type", "") != "url":
                     continue
                 url = str(self._field(source, "url", "") or "").strip()
-                if url and url not in ordered_urls:
-                    ordered_urls.append(url)
+                if url:
+                    ordered_urls.setdefault(url)
 
         for cited_url in citation_map:
-            if cited_url and cited_url not in ordered_urls:
-                ordered_urls.append(cited_url)
+            if cited_url:
+                ordered_urls.setdefault(cited_url)
 
         results: list[dict[str, str]] = []
         for url in ordered_urls:
@@ -427,6 +448,22 @@ def validate_search_provider_configuration() -> str:
     return "Search provider ready (`SEARCH_PROVIDER=tavily`)."
 
 
+def _chat_model_settings_key() -> tuple[tuple[str, str], ...]:
+    # Rotated keys or base URLs (e.g. via update_project_dotenv) must build a fresh client, not reuse the old one.
+    return tuple(sorted(item for item in os.environ.items() if item[0].endswith(_CHAT_MODEL_ENV_SUFFIXES)))
+
+
+@functools.lru_cache(maxsize=8)
+def _init_chat_model_cached(
+    factory: Any,
+    init_items: tuple[tuple[str, Any], ...],
+    env_settings: tuple[tuple[str, str], ...],
+):
+    """Build one chat model per resolved configuration and credential env so HTTP clients are reused."""
+    del env_settings
+    return factory(**dict(init_items))
+
+
 def get_llm(role: ModelRole = "orchestrator", *, prefer_compact_context: bool = False):
     """Return a ChatModel for 'orchestrator' or 'subagent' role.
 
@@ -444,11 +481,13 @@ def get_llm(role: ModelRole = "orchestrator", *, prefer_compact_context: bool =
         if openai_use_previous_response_id_enabled() or prefer_compact_context:
             init_kwargs["use_previous_response_id"] = True
 
+    # Env is still resolved per call; only the constructed client is shared across identical configs.
+    env_settings = _chat_model_settings_key()
     try:
-        return init_chat_model(**init_kwargs)
+        return _init_chat_model_cached(init_chat_model, tuple(init_kwargs.items()), env_settings)
     except TypeError:
         if model.startswith("openai:") and "use_responses_api" in init_kwargs:
-            return init_chat_model(model=model)
+            return _init_chat_model_cached(init_chat_model, (("model", model),), env_settings)
         raise
 
 
@@ -472,3 +511,8 @@ def get_search_tool():
     _resolve_required_tavily_key()  # validate key exists before constructing
     tavily_search_cls = _load_tavily_search_class()
     return tavily_search_cls()  # reads TAVILY_API_KEY from env
+
+
+def search_tool_settings_key() -> tuple[tuple[str, str], ...]:
+    """Return the env settings that can change what `get_search_tool()` builds, for use as a cache key."""
+    return tuple(sorted(item for item in os.environ.items() if item[0].startswith(_SEARCH_TOOL_ENV_PREFIXES)))
@@ -185,7 +185,8 @@ def _discover_dotenv_path_from_cwd() -> Path | None:
 
 
 def _model_requires_openai_key(model: str) -> bool:
-    return str(model).strip().lower().startswith("openai:")
+    # Lowercase only the prefix under test rather than the whole model identifier.
+    return str(model).lstrip()[:7].lower() == "openai:"
 
 
 def _required_runtime_env_vars() -> set[str]:
@@ -255,7 +256,7 @@ def verify_langsmith_auth(project_name: str | None = None) -> tuple[bool, str]:
         client = Client()
         list(client.list_runs(project_name=resolved_project, limit=1))
     except Exception as exc:  # pragma: no cover - network/provider dependent
-        error_head = str(exc).splitlines()[0].strip() or exc.__class__.__name__
+        error_head = str(exc).partition("\n")[0].strip() or exc.__class__.__name__
         return (
             False,
             "LangSmith auth failed. Verify `LANGCHAIN_API_KEY` and `LANGCHAIN_ENDPOINT`. "
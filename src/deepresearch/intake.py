@@ -7,12 +7,12 @@ from types import SimpleNamespace
 from typing import Any, Literal
 
 from langchain_core.messages import AIMessage, HumanMessage, get_buffer_string
-from langchain_core.messages.utils import convert_to_messages
 from langchain_core.runnables.config import RunnableConfig
 from langgraph.graph import END
 from langgraph.types import Command
 
 from .config import get_llm, get_max_concurrent_research_units, get_max_structured_output_retries
+from .message_utils import coerce_messages
 from .prompts import CLARIFY_PROMPT, RESEARCH_BRIEF_PROMPT, RESEARCH_PLAN_PROMPT
 from .runtime_utils import invoke_structured_with_retries
 from .state import (
@@ -25,13 +25,13 @@ from .state import (
     ResearchBrief,
     ResearchPlan,
     ResearchState,
-    has_scope_boundary,
-    is_broad_scope_request,
+    classify_scope,
     latest_human_text,
     should_recheck_intent_on_follow_up,
     today_utc_date,
 )
 
+_WHITESPACE_RUN_RE = re.compile(r"\s+")
 _PLAN_ACK_NEGATED_POSITIVE_RE = re.compile(r"\b(?:don't|do not|not)\s+(?:start|proceed|continue|launch)\b")
 _PLAN_ACK_STRONG_POSITIVE_RE = re.compile(r"\b(?:start|proceed|continue|launch)\b")
 _PLAN_ACK_GO_AHEAD_RE = re.compile(r"\bgo\s+ahead\b")
@@ -75,8 +75,8 @@ def _should_run_clarification_pass(state: ResearchState, messages: list[Any]) ->
     return True
 
 
-def _needs_scope_boundary_clarification(messages: list[Any]) -> bool:
-    return is_broad_scope_request(messages) and not has_scope_boundary(messages)
+def _needs_scope_boundary_clarification(is_broad_scope: bool, has_boundary: bool) -> bool:
+    return is_broad_scope and not has_boundary
 
 
 def _format_plan_message(plan: ResearchPlan) -> str:
@@ -148,7 +148,7 @@ def _build_research_handoff_update(research_brief: str) -> dict[str, Any]:
 
 
 def _state_messages(state: ResearchState) -> list[Any]:
-    return list(convert_to_messages(state.get("messages", [])))
+    return coerce_messages(state.get("messages"))
 
 
 def _is_plan_review_turn(state: ResearchState) -> bool:
@@ -160,7 +160,7 @@ def _is_plan_review_turn(state: ResearchState) -> bool:
 
 
 def _is_plan_acknowledgement_message(messages: list[Any]) -> bool:
-    latest_text = re.sub(r"\s+", " ", latest_human_text(messages).lower()).strip()
+    latest_text = _WHITESPACE_RUN_RE.sub(" ", latest_human_text(messages).lower()).strip()
     if not latest_text:
         return False
     if _PLAN_ACK_NEGATED_POSITIVE_RE.search(latest_text):
@@ -288,7 +288,9 @@ async def _handle_clarification_or_plan(
     if not latest_user_text:
         return _missing_user_text_command()
 
-    if _needs_scope_boundary_clarification(messages):
+    # Both scope predicates share one join of the human turns; the broad flag is reused after the model calls.
+    is_broad_scope, has_boundary = classify_scope(messages)
+    if _needs_scope_boundary_clarification(is_broad_scope, has_boundary):
         return _scope_boundary_clarification_command(follow_up_topic_shift=follow_up_topic_shift)
 
     response = await _invoke_clarification_check(messages, config)
@@ -297,7 +299,7 @@ async def _handle_clarification_or_plan(
         return _clarification_command(question, follow_up_topic_shift=follow_up_topic_shift)
 
     research_brief = await _generate_research_brief(messages, config)
-    if is_broad_scope_request(messages):
+    if is_broad_scope:
         plan = await _generate_research_plan(research_brief, config)
         return Command(
             goto=END,
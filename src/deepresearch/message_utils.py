@@ -2,8 +2,49 @@
 
 from __future__ import annotations
 
+from operator import attrgetter
 from typing import Any
 
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.messages.utils import convert_to_messages
+
+
+def coerce_messages(raw_messages: Any) -> list[BaseMessage]:
+    """Return state messages as a list, converting only when entries are not already BaseMessages.
+
+    A state list that already holds only BaseMessages is returned as-is, so callers must treat it as read-only.
+    """
+    if not raw_messages:
+        return []
+    messages = raw_messages if type(raw_messages) is list else list(raw_messages)
+    # add_messages reducers already store BaseMessages, so the common case needs no copy or conversion at all.
+    if all(isinstance(message, BaseMessage) for message in messages):
+        return messages
+    return list(convert_to_messages(messages))
+
+
+_read_type_and_content = attrgetter("type", "content")
+
+
+def message_type_and_content(message: Any) -> tuple[Any, Any]:
+    """Return a message's `type` and `content`, defaulting to empty strings for objects missing either."""
+    # attrgetter reads both fields in one C call; only objects missing one pay for the getattr defaults.
+    try:
+        return _read_type_and_content(message)
+    except AttributeError:
+        return getattr(message, "type", ""), getattr(message, "content", "")
+
+
+def latest_raw_ai_message(raw_messages: Any) -> AIMessage | None:
+    """Return the newest AI message, converting only the entries visited while scanning backwards."""
+    if not raw_messages:
+        return None
+    for raw_message in reversed(raw_messages):
+        message = raw_message if isinstance(raw_message, BaseMessage) else convert_to_messages([raw_message])[0]
+        if message.type == "ai":
+            return message
+    return None
+
 
 def extract_text_content(content: Any) -> str:
     """Extract plain text from LangChain/OpenAI-style content payloads."""
@@ -2,14 +2,33 @@
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Callable
 import ipaddress
+import re
 from typing import Any
 from urllib.parse import urlparse
+import weakref
 
 from langchain_core.tools import tool
 
 MAX_SEARCH_RESULTS_FOR_AGENT = 8
+_NON_ALNUM_RUN_PATTERN = re.compile(r"[^a-z0-9]+")
+_NON_WHITESPACE_PATTERN = re.compile(r"\S")
+# In-flight caps shared by every researcher in a run, so parallel units don't trip provider rate limits.
+_TOOL_CONCURRENCY_LIMITS = {"search_web": 4, "fetch_url": 8}
+_tool_semaphores: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, asyncio.Semaphore]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _tool_semaphore(tool_name: str) -> asyncio.Semaphore:
+    """Return the running loop's semaphore for one network-bound tool."""
+    semaphores = _tool_semaphores.setdefault(asyncio.get_running_loop(), {})
+    semaphore = semaphores.get(tool_name)
+    if semaphore is None:
+        semaphore = semaphores[tool_name] = asyncio.Semaphore(_TOOL_CONCURRENCY_LIMITS[tool_name])
+    return semaphore
 
 
 def _is_non_public_ip(hostname: str) -> bool:
@@ -60,9 +79,7 @@ def _format_fetch_error(exc: Exception) -> str:
 
 def _normalize_text_key(text: str) -> str:
     """Normalize text for duplicate checks and deterministic ordering."""
-    import re
-
-    return re.sub(r"[^a-z0-9]+", " ", text.lower()).strip()
+    return _NON_ALNUM_RUN_PATTERN.sub(" ", text.lower()).strip()
 
 
 def _result_object_to_dict(obj: Any) -> dict[str, Any]:
@@ -126,44 +143,55 @@ def _sort_search_results(results: list[dict[str, Any]]) -> list[dict[str, Any]]:
     )
 
 
+def _leading_text_window(value: Any, max_chars: int) -> str:
+    """Return up to `max_chars` of text after leading whitespace without copying the full body."""
+    text = str(value or "")
+    first_visible = _NON_WHITESPACE_PATTERN.search(text)
+    if first_visible is None:
+        return ""
+    start = first_visible.start()
+    return text[start : start + max_chars].rstrip()
+
+
 def _extract_search_snippet(result: dict[str, Any], max_chars: int = 1200) -> str:
     """Extract a bounded text snippet from raw provider search output."""
     highlights = result.get("highlights")
     highlight_chunks: list[str] = []
+    highlight_chars = 0
 
     if isinstance(highlights, str):
-        highlight_chunks = [highlights]
+        highlight_chunks = [highlights.strip()]
     elif isinstance(highlights, list):
         for item in highlights:
+            chunk: str | None = None
             if isinstance(item, str):
-                highlight_chunks.append(item)
+                chunk = item
             elif isinstance(item, dict):
                 for key in ("text", "highlight", "content", "snippet"):
                     value = item.get(key)
                     if value:
-                        highlight_chunks.append(str(value))
+                        chunk = str(value)
                         break
             elif item is not None:
-                highlight_chunks.append(str(item))
-
-            if len(highlight_chunks) >= 6:
+                chunk = str(item)
+
+            if chunk is not None:
+                chunk = chunk.strip()
+                highlight_chunks.append(chunk)
+                highlight_chars += len(chunk)
+            # Past max_chars any further highlight would be cut by the final slice, so stop collecting.
+            if len(highlight_chunks) >= 6 or highlight_chars >= max_chars:
                 break
 
-    highlight_text = "\n".join(chunk.strip() for chunk in highlight_chunks if str(chunk).strip()).strip()
+    # Every chunk is stripped on entry, so the join only has to skip empty ones.
+    highlight_text = "\n".join(chunk for chunk in highlight_chunks if chunk)
     if highlight_text:
         return highlight_text[:max_chars]
 
-    raw_content = str(result.get("raw_content") or "").strip()
-    if raw_content:
-        return raw_content[:max_chars]
-
-    content = str(result.get("content") or "").strip()
-    if content:
-        return content[:max_chars]
-
-    text = str(result.get("text") or "").strip()
-    if text:
-        return text[:max_chars]
+    for key in ("raw_content", "content", "text"):
+        snippet = _leading_text_window(result.get(key), max_chars)
+        if snippet:
+            return snippet
 
     return "[No content available]"
 
@@ -241,11 +269,14 @@ def _build_fetch_url_tool(
         emit({"event": "fetch_url", "url": url})
 
         try:
-            async with httpx.AsyncClient(
-                timeout=httpx.Timeout(connect=10.0, read=30.0, write=10.0, pool=10.0),
-                follow_redirects=True,
-                headers={"User-Agent": "Mozilla/5.0 (compatible; DeepResearchBot/1.0)"},
-            ) as client:
+            async with (
+                _tool_semaphore("fetch_url"),
+                httpx.AsyncClient(
+                    timeout=httpx.Timeout(connect=10.0, read=30.0, write=10.0, pool=10.0),
+                    follow_redirects=True,
+                    headers={"User-Agent": "Mozilla/5.0 (compatible; DeepResearchBot/1.0)"},
+                ) as client,
+            ):
                 response = await client.get(url)
                 response.raise_for_status()
                 html = response.text
@@ -292,9 +323,10 @@ def _build_search_tool_with_processing(
             writer(event)
 
     async def invoke_search(payload: Any) -> Any:
-        if hasattr(base_search_tool, "ainvoke"):
-            return await base_search_tool.ainvoke(payload)
-        return base_search_tool.invoke(payload)
+        async with _tool_semaphore("search_web"):
+            if hasattr(base_search_tool, "ainvoke"):
+                return await base_search_tool.ainvoke(payload)
+            return base_search_tool.invoke(payload)
 
     @tool("search_web", parse_docstring=True)
     async def search_web(query: str) -> str:
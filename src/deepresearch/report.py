@@ -3,10 +3,11 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
 import re
+from itertools import filterfalse
 from typing import Any
-from urllib.parse import urlparse
 
 from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
 from langchain_core.runnables.config import RunnableConfig
@@ -19,10 +20,12 @@ from .state import (
     EvidenceRecord,
     ResearchState,
     compress_note_text,
+    is_http_source_url,
     is_token_limit_error,
     join_note_list,
     normalize_evidence_ledger,
     normalize_note_list,
+    normalize_source_url,
     state_text_or_none,
     stringify_tool_output,
     today_utc_date,
@@ -30,97 +33,118 @@ from .state import (
 
 _logger = logging.getLogger(__name__)
 
-_SOURCE_URL_PATTERN = re.compile(r"https?://[^\s<>\]\"')]+")
-_SOURCE_SECTION_HEADER_PATTERN = re.compile(r"(?im)^\s{0,3}(?:#{1,6}\s*)?(?:sources?|references?)\s*:?\s*$")
+# Possessive (3.11+ stdlib) so a URL run is consumed once with no backtracking probes.
+_SOURCE_URL_PATTERN = re.compile(r"https?://[^\s<>\]\"')]++")
+_SOURCE_SECTION_HEADER_SOURCE = r"^\s{0,3}(?:#{1,6}\s*)?(?:sources?|references?)\s*:?\s*$"
+# Fused so one sweep of the final report finds both its cited URLs and any Sources/References header.
+_REPORT_SOURCE_SCAN_PATTERN = re.compile(
+    rf"(?P<header>(?im:{_SOURCE_SECTION_HEADER_SOURCE}))|(?P<url>{_SOURCE_URL_PATTERN.pattern})"
+)
 _NO_SOURCE_URLS_SENTINEL_PATTERN = re.compile(
     r"(?im)^\s*[-*]?\s*No source URLs were available in collected notes\.?\s*$"
 )
-_INTERNAL_META_LINE_PATTERNS = (
-    re.compile(r"(?i)^\s*\[(?:ConductResearch|ResearchComplete|Research unit failed|ConductResearch skipped).*"),
-    re.compile(r"(?i)^\s*Reflection recorded:"),
-    re.compile(r"(?i)^\s*(?:Raw|Compressed) notes so far\s*:"),
-    re.compile(r"(?i)\b(?:tool_call_id|supervisor_research_|supervisor_think_)\b"),
-    re.compile(
-        r"(?i)\b(?:i|we)\s+(?:used|called|ran|invoked)\s+(?:the\s+)?"
+_BLANK_LINE_RUN_PATTERN = re.compile(r"\n{3,}")
+_FINALIZE_OFFLOAD_THRESHOLD_CHARS = 65_536
+_SEED_COMPRESSION_MIN_CHARS = 2_048
+_INTERNAL_META_LINE_PATTERN_SOURCES = (
+    r"^\s*\[(?:ConductResearch|ResearchComplete|Research unit failed|ConductResearch skipped).*",
+    r"^\s*Reflection recorded:",
+    r"^\s*(?:Raw|Compressed) notes so far\s*:",
+    r"\b(?:tool_call_id|supervisor_research_|supervisor_think_)\b",
+    (
+        r"\b(?:i|we)\s+(?:used|called|ran|invoked)\s+(?:the\s+)?"
         r"(?:ConductResearch|ResearchComplete|search_web|fetch_url|think_tool)\b"
     ),
 )
+# One fused alternation so each report line costs a single regex search.
+_INTERNAL_META_LINE_PATTERN = re.compile(
+    "|".join(f"(?:{source})" for source in _INTERNAL_META_LINE_PATTERN_SOURCES),
+    re.IGNORECASE,
+)
+# Multiline twin used to sweep the whole report once before doing any per-line work.
+_INTERNAL_META_LINE_SCAN_PATTERN = re.compile(_INTERNAL_META_LINE_PATTERN.pattern, re.IGNORECASE | re.MULTILINE)
+# Line boundaries str.splitlines() honours but MULTILINE `^` does not; any of them forces the per-line filter.
+_NON_NEWLINE_LINE_BREAK_PATTERN = re.compile(r"[\r\v\f\x1c-\x1e\x85\u2028\u2029]")
 
 
-def _normalize_source_url(raw_url: str) -> str:
-    return str(raw_url).strip().rstrip(".,;")
+@functools.lru_cache(maxsize=8)
+def render_final_report_prompt(current_date: str) -> str:
+    # The policy prompt only varies by date, so one render serves every synthesis in a run.
+    return FINAL_REPORT_PROMPT.format(current_date=current_date)
 
 
 def _is_valid_source_url(raw_url: str) -> bool:
-    normalized = _normalize_source_url(raw_url)
-    if not normalized or normalized.endswith("-"):
-        return False
-    parsed = urlparse(normalized)
-    return parsed.scheme.lower() in {"http", "https"} and bool(parsed.netloc)
+    normalized = normalize_source_url(raw_url)
+    return not normalized.endswith("-") and is_http_source_url(normalized)
 
 
 def _extract_source_urls(*chunk_groups: list[str]) -> list[str]:
-    seen: set[str] = set()
-    ordered_urls: list[str] = []
+    ordered_urls: dict[str, None] = {}
     for chunk_group in chunk_groups:
         for chunk in chunk_group:
+            if "http" not in chunk:
+                continue
             for match in _SOURCE_URL_PATTERN.findall(chunk):
-                url = _normalize_source_url(match)
-                if not _is_valid_source_url(url) or url in seen:
-                    continue
-                seen.add(url)
-                ordered_urls.append(url)
-    return ordered_urls
+                url = normalize_source_url(match)
+                if url not in ordered_urls and _is_valid_source_url(url):
+                    ordered_urls[url] = None
+    return list(ordered_urls)
 
 
 def _extract_source_urls_from_evidence(evidence_ledger: list[EvidenceRecord]) -> list[str]:
-    seen: set[str] = set()
-    ordered_urls: list[str] = []
+    # EvidenceRecord normalizes source_urls on construction, so only validity and cross-record dedupe remain.
+    ordered_urls: dict[str, None] = {}
     for record in evidence_ledger:
         for url in record.source_urls:
-            normalized = _normalize_source_url(url)
-            if not _is_valid_source_url(normalized) or normalized in seen:
-                continue
-            seen.add(normalized)
-            ordered_urls.append(normalized)
-    return ordered_urls
+            if url not in ordered_urls and _is_valid_source_url(url):
+                ordered_urls[url] = None
+    return list(ordered_urls)
 
 
 def _merge_unique_urls(*url_groups: list[str]) -> list[str]:
-    seen: set[str] = set()
-    merged: list[str] = []
-    for group in url_groups:
-        for url in group:
-            normalized = _normalize_source_url(url)
-            if not _is_valid_source_url(normalized) or normalized in seen:
-                continue
-            seen.add(normalized)
-            merged.append(normalized)
-    return merged
+    # Groups come from the extractors above, so URLs are already normalized and validated.
+    return list(dict.fromkeys(url for group in url_groups for url in group))
 
 
 def _remove_internal_meta_lines(report_text: str) -> str:
-    filtered_lines: list[str] = []
-    for line in report_text.splitlines():
-        stripped = line.strip()
-        if stripped and any(pattern.search(stripped) for pattern in _INTERNAL_META_LINE_PATTERNS):
-            continue
-        filtered_lines.append(line)
+    if (
+        _NON_NEWLINE_LINE_BREAK_PATTERN.search(report_text) is None
+        and _INTERNAL_META_LINE_SCAN_PATTERN.search(report_text) is None
+    ):
+        # Common case: no meta lines anywhere, so skip the split/filter/join round-trip.
+        cleaned = report_text
+    else:
+        # Every alternative needs non-space text, so blank lines never match and the bound search can filter directly.
+        cleaned = "\n".join(filterfalse(_INTERNAL_META_LINE_PATTERN.search, report_text.splitlines()))
 
-    cleaned = "\n".join(filtered_lines)
-    cleaned = re.sub(r"\n{3,}", "\n\n", cleaned)
+    cleaned = _BLANK_LINE_RUN_PATTERN.sub("\n\n", cleaned)
     return cleaned.strip()
 
 
 def _sanitize_final_report_text(final_report: str) -> str:
     report_text = state_text_or_none(final_report) or FALLBACK_FINAL_REPORT
-    report_text = _remove_internal_meta_lines(report_text)
-    return state_text_or_none(report_text) or FALLBACK_FINAL_REPORT
+    # _remove_internal_meta_lines returns stripped text, so only emptiness needs checking.
+    return _remove_internal_meta_lines(report_text) or FALLBACK_FINAL_REPORT
+
+
+def _scan_report_sources(report_text: str) -> tuple[list[str], bool]:
+    """Return the report's valid cited URLs in order and whether it already has a source section."""
+    ordered_urls: dict[str, None] = {}
+    has_source_section = False
+    for match in _REPORT_SOURCE_SCAN_PATTERN.finditer(report_text):
+        raw_url = match.group("url")
+        if raw_url is None:
+            has_source_section = True
+            continue
+        url = normalize_source_url(raw_url)
+        if url not in ordered_urls and _is_valid_source_url(url):
+            ordered_urls[url] = None
+    return list(ordered_urls), has_source_section
 
 
 def _strip_no_source_urls_sentinel(report_text: str) -> str:
     cleaned = _NO_SOURCE_URLS_SENTINEL_PATTERN.sub("", report_text)
-    cleaned = re.sub(r"\n{3,}", "\n\n", cleaned)
+    cleaned = _BLANK_LINE_RUN_PATTERN.sub("\n\n", cleaned)
     return cleaned.strip()
 
 
@@ -131,19 +155,21 @@ def _ensure_source_transparency_markers(
     evidence_ledger: list[EvidenceRecord],
 ) -> str:
     report_text = state_text_or_none(final_report) or FALLBACK_FINAL_REPORT
+    # The sentinel line holds neither a URL nor a header, so scanning before stripping it sees the same sources.
+    report_urls, has_source_section = _scan_report_sources(report_text)
+    report_text = _strip_no_source_urls_sentinel(report_text) or FALLBACK_FINAL_REPORT
+    if has_source_section and report_urls:
+        # The report already cites its sources, so the note/evidence scans cannot change the output.
+        return report_text
+
     source_urls = _merge_unique_urls(
         _extract_source_urls(note_chunks, raw_note_chunks),
         _extract_source_urls_from_evidence(evidence_ledger),
-        _extract_source_urls([report_text]),
+        report_urls,
     )
-    report_urls = _extract_source_urls([report_text])
-
-    report_text = _strip_no_source_urls_sentinel(report_text)
-    report_text = state_text_or_none(report_text) or FALLBACK_FINAL_REPORT
-    has_source_section = bool(_SOURCE_SECTION_HEADER_PATTERN.search(report_text))
 
     if has_source_section:
-        if source_urls and not report_urls:
+        if source_urls:
             source_lines = "\n".join(f"- {url}" for url in source_urls)
             return f"{report_text.rstrip()}\n{source_lines}"
         return report_text
@@ -166,12 +192,35 @@ def _normalized_report_inputs(state: ResearchState) -> tuple[list[str], list[str
 def _seed_compressed_notes(note_chunks: list[str], raw_note_chunks: list[str]) -> list[str]:
     if note_chunks or not raw_note_chunks:
         return note_chunks
-    compressed_seed = compress_note_text(join_note_list(raw_note_chunks))
+    raw_text = join_note_list(raw_note_chunks) or ""
+    if len(raw_text) < _SEED_COMPRESSION_MIN_CHARS:
+        # Small raw notes already fit comfortably in the synthesis prompt; bulletizing them buys nothing.
+        return [raw_text] if raw_text else note_chunks
+    compressed_seed = compress_note_text(raw_text)
     if not compressed_seed:
         return note_chunks
     return [compressed_seed]
 
 
+def _chunks_within_char_budget(chunks: list[str], attempt: int) -> list[str]:
+    # Token-limit retries shrink the payload by size, not chunk count: the chunk that crosses the budget is cut
+    # to the remaining room, so even a single oversized note gets smaller on every retry.
+    total_chars = sum(map(len, chunks))
+    if not total_chars:
+        return []
+    remaining_chars = max(1, total_chars // (attempt + 1))
+    selected: list[str] = []
+    for chunk in chunks:
+        if len(chunk) > remaining_chars:
+            selected.append(chunk[:remaining_chars])
+            break
+        selected.append(chunk)
+        remaining_chars -= len(chunk)
+        if not remaining_chars:
+            break
+    return selected
+
+
 def _synthesis_chunks_for_attempt(
     note_chunks: list[str],
     raw_note_chunks: list[str],
@@ -181,10 +230,8 @@ def _synthesis_chunks_for_attempt(
         prompt_note_chunks = note_chunks
         prompt_raw_chunks = raw_note_chunks
     else:
-        note_limit = max(1, len(note_chunks) // (attempt + 1)) if note_chunks else 0
-        raw_limit = max(1, len(raw_note_chunks) // (attempt + 1)) if raw_note_chunks else 0
-        prompt_note_chunks = note_chunks[:note_limit] if note_limit else []
-        prompt_raw_chunks = raw_note_chunks[:raw_limit] if raw_limit else []
+        prompt_note_chunks = _chunks_within_char_budget(note_chunks, attempt)
+        prompt_raw_chunks = _chunks_within_char_budget(raw_note_chunks, attempt)
 
     # Prefer compressed notes. Raw notes are usually tool-heavy and can overflow
     # the orchestrator context window, so only include them when no compressed notes exist.
@@ -217,6 +264,8 @@ async def _synthesize_with_retries(
     config: RunnableConfig | None,
 ) -> str | None:
     model = get_llm("orchestrator")
+    # Retries only shrink the notes payload; the policy prompt is identical across attempts.
+    policy_message = SystemMessage(content=render_final_report_prompt(today_utc_date()))
     max_attempts = 3
     for attempt in range(max_attempts):
         prompt_note_chunks, prompt_raw_chunks = _synthesis_chunks_for_attempt(
@@ -224,14 +273,13 @@ async def _synthesize_with_retries(
             raw_note_chunks,
             attempt,
         )
-        policy_prompt = FINAL_REPORT_PROMPT.format(current_date=today_utc_date())
         synthesis_payload = _build_synthesis_payload(state, prompt_note_chunks, prompt_raw_chunks)
 
         try:
             response = await invoke_runnable_with_config(
                 model,
                 [
-                    SystemMessage(content=policy_prompt),
+                    policy_message,
                     HumanMessage(content=synthesis_payload),
                 ],
                 config,
@@ -290,7 +338,9 @@ def _finalize_report_text(
     evidence_ledger: list[EvidenceRecord],
 ) -> str:
     report_text = final_report or _fallback_report_text(note_chunks, raw_note_chunks)
-    report_text = _sanitize_final_report_text(report_text)
+    if report_text != FALLBACK_FINAL_REPORT:
+        # The default fallback message carries no model or note text, so there is nothing to sanitize.
+        report_text = _sanitize_final_report_text(report_text)
     return _ensure_source_transparency_markers(
         report_text,
         note_chunks,
@@ -299,6 +349,25 @@ def _finalize_report_text(
     )
 
 
+async def _finalize_report_text_async(
+    final_report: str | None,
+    note_chunks: list[str],
+    raw_note_chunks: list[str],
+    evidence_ledger: list[EvidenceRecord],
+) -> str:
+    input_chars = len(final_report or "") + sum(map(len, note_chunks)) + sum(map(len, raw_note_chunks))
+    if input_chars <= _FINALIZE_OFFLOAD_THRESHOLD_CHARS:
+        return _finalize_report_text(final_report, note_chunks, raw_note_chunks, evidence_ledger)
+    # Regex scans hold the GIL, so move the whole pass off the event loop once instead of fanning out per extractor.
+    return await asyncio.to_thread(
+        _finalize_report_text,
+        final_report,
+        note_chunks,
+        raw_note_chunks,
+        evidence_ledger,
+    )
+
+
 def _final_report_update(final_report: str) -> dict[str, Any]:
     return {
         "messages": [AIMessage(content=final_report)],
@@ -320,7 +389,7 @@ async def final_report_generation(
         note_chunks = _seed_compressed_notes(note_chunks, raw_note_chunks)
         final_report = await _synthesize_with_retries(state, note_chunks, raw_note_chunks, config)
 
-    final_report = _finalize_report_text(
+    final_report = await _finalize_report_text_async(
         final_report,
         note_chunks,
         raw_note_chunks,
@@ -2,18 +2,29 @@
 
 from __future__ import annotations
 
+import functools
 import re
+import sys
+from collections.abc import Collection, Iterator
 from typing import Any
-from urllib.parse import urlparse
 
 from .config import (
-    get_max_react_tool_calls,
     get_llm,
+    get_max_react_tool_calls,
     get_search_tool,
+    search_tool_settings_key,
 )
+from .message_utils import message_type_and_content
 from .nodes import _build_fetch_url_tool, _build_search_tool_with_processing, think_tool
 from .prompts import RESEARCHER_PROMPT
-from .state import EvidenceRecord, EvidenceSourceType, state_text_or_none, stringify_tool_output, today_utc_date
+from .state import (
+    EvidenceRecord,
+    EvidenceSourceType,
+    is_http_source_url,
+    normalize_source_url,
+    stringify_tool_output,
+    today_utc_date,
+)
 
 try:  # pragma: no cover - import is environment-dependent
     from deepagents import create_deep_agent as _deepagents_create_deep_agent
@@ -24,7 +35,10 @@ except ImportError:  # pragma: no cover - defensive fallback for environments wi
 create_deep_agent = _deepagents_create_deep_agent
 
 _URL_PATTERN = re.compile(r"https?://[^\s<>\]\"')]+")
-_SEARCH_URL_LINE_PATTERN = re.compile(r"(?im)^\s*URL:\s*(\S+)")
+_SEARCH_URL_LINE_PATTERN = re.compile(r"(?m)^[ \t]*URL:[ \t]*(\S+)")
+# Interned so name comparisons in the per-message trace loops can hit the identity fast path.
+_THINK_TOOL_NAME = sys.intern(think_tool.name)
+_cached_researcher_graph: tuple[tuple[Any, ...], Any] | None = None
 
 
 def _resolve_create_deep_agent():
@@ -42,9 +56,22 @@ def _resolve_create_deep_agent():
     return runtime_create_deep_agent
 
 
+@functools.lru_cache(maxsize=8)
+def _cached_research_tools(search_settings: tuple[tuple[str, str], ...]) -> tuple[Any, ...]:
+    # Writer-free tools depend only on the search env (provider, keys, web-search options), so build once per config.
+    return tuple(_build_research_tools(None))
+
+
 def _build_research_tools_and_capabilities(
     writer: Any | None = None,
 ) -> list[Any]:
+    if writer is None:
+        # Env is still read per call so key or option overrides apply immediately; only tool construction is shared.
+        return list(_cached_research_tools(search_tool_settings_key()))
+    return _build_research_tools(writer)
+
+
+def _build_research_tools(writer: Any | None) -> list[Any]:
     base_search_tool = get_search_tool()
     fetch_url_tool = _build_fetch_url_tool(writer)
     tools = [think_tool, fetch_url_tool]
@@ -53,138 +80,134 @@ def _build_research_tools_and_capabilities(
     return tools
 
 
-def render_researcher_prompt(current_date: str) -> str:
+@functools.lru_cache(maxsize=8)
+def _render_researcher_prompt_cached(max_react_tool_calls: int, current_date: str) -> str:
     return RESEARCHER_PROMPT.format(
-        max_react_tool_calls=get_max_react_tool_calls(),
+        max_react_tool_calls=max_react_tool_calls,
         current_date=current_date,
     )
 
 
+def render_researcher_prompt(current_date: str) -> str:
+    # Budget is read per call so config changes still apply; only the template render is memoized.
+    return _render_researcher_prompt_cached(get_max_react_tool_calls(), current_date)
+
+
 def build_researcher_subgraph():
     """Build a deep-agent researcher with built-in middleware."""
+    global _cached_researcher_graph
     model = get_llm("subagent", prefer_compact_context=True)
     tools = _build_research_tools_and_capabilities()
     system_prompt = render_researcher_prompt(current_date=today_utc_date())
     create_agent = _resolve_create_deep_agent()
 
-    return create_agent(
+    # Every research unit asks for a graph; inputs are resolved per call (and are themselves cached), so the
+    # compiled agent is reused until the model, tools, prompt, or factory actually change.
+    build_key = (system_prompt, create_agent, model, *tools)
+    if _cached_researcher_graph is not None and _same_build_inputs(_cached_researcher_graph[0], build_key):
+        return _cached_researcher_graph[1]
+
+    researcher_graph = create_agent(
         model=model,
         tools=tools,
         system_prompt=system_prompt,
         name="deep-researcher",
     )
+    _cached_researcher_graph = (build_key, researcher_graph)
+    return researcher_graph
 
 
-def _normalize_url(url: str) -> str:
-    return url.strip().rstrip(".,;")
-
-
-def _is_http_url(url: str) -> bool:
-    normalized = _normalize_url(url)
-    if not normalized:
-        return False
-    parsed = urlparse(normalized)
-    return parsed.scheme.lower() in {"http", "https"} and bool(parsed.netloc)
+def _same_build_inputs(cached_key: tuple[Any, ...], build_key: tuple[Any, ...]) -> bool:
+    # Prompt compares by value; the factory, model, and tools must be the very same objects.
+    return (
+        len(cached_key) == len(build_key)
+        and cached_key[0] == build_key[0]
+        and all(cached is current for cached, current in zip(cached_key[1:], build_key[1:]))
+    )
 
 
 def _extract_evidence_records(
     raw_text: str,
     *,
     source_type: EvidenceSourceType = "fetched",
+    skip_urls: Collection[str] = (),
 ) -> list[EvidenceRecord]:
-    """Extract one EvidenceRecord per unique URL found in researcher output."""
+    """Extract one EvidenceRecord per unique URL found in researcher output, ignoring `skip_urls`."""
     text = raw_text.strip()
-    if not text:
+    # Cheap literal prescan: no "http" means the URL regex cannot match anywhere.
+    if "http" not in text:
         return []
 
-    seen: set[str] = set()
+    seen: set[str] = set(skip_urls)
     records: list[EvidenceRecord] = []
     for raw_url in _URL_PATTERN.findall(text):
-        url = _normalize_url(raw_url)
-        if not _is_http_url(url) or url in seen:
+        url = normalize_source_url(raw_url)
+        if not is_http_source_url(url) or url in seen:
             continue
         seen.add(url)
-        records.append(
-            EvidenceRecord(
-                source_urls=[url],
-                source_type=source_type,
-            )
-        )
+        # The URL is already normalized and validated, so skip re-running the pydantic validators.
+        records.append(EvidenceRecord.model_construct(source_urls=[url], source_type=source_type))
     return records
 
 
 def _tool_call_lookup(messages: list[Any]) -> dict[str, dict[str, Any]]:
-    lookup: dict[str, dict[str, Any]] = {}
-    for msg in messages:
-        if getattr(msg, "type", "") != "ai":
-            continue
-        raw_tool_calls = getattr(msg, "tool_calls", None)
-        if not isinstance(raw_tool_calls, list):
-            continue
-        for raw_call in raw_tool_calls:
-            if not isinstance(raw_call, dict):
-                continue
-            call_id = str(raw_call.get("id") or "").strip()
-            if not call_id:
-                continue
-            args = raw_call.get("args") if isinstance(raw_call.get("args"), dict) else {}
-            lookup[call_id] = {
-                "name": str(raw_call.get("name") or "").strip(),
-                "args": args,
-            }
-    return lookup
-
-
-def _extract_fetched_evidence_from_messages(messages: list[Any]) -> list[EvidenceRecord]:
-    """Extract URLs that came from actual search/fetch tool usage."""
+    return {
+        call_id: {
+            "name": str(raw_call.get("name") or "").strip(),
+            "args": args if isinstance(args := raw_call.get("args"), dict) else {},
+        }
+        for msg in messages
+        if getattr(msg, "type", "") == "ai" and isinstance(raw_tool_calls := getattr(msg, "tool_calls", None), list)
+        for raw_call in raw_tool_calls
+        if isinstance(raw_call, dict) and (call_id := str(raw_call.get("id") or "").strip())
+    }
+
+
+def _iter_tool_urls(messages: list[Any]) -> Iterator[str]:
+    """Yield raw URLs that came from actual search/fetch tool usage, in trace order."""
     call_lookup = _tool_call_lookup(messages)
-    seen_urls: set[str] = set()
-    records: list[EvidenceRecord] = []
-
-    def add_url(raw_url: str) -> None:
-        url = _normalize_url(raw_url)
-        if not _is_http_url(url) or url in seen_urls:
-            return
-        seen_urls.add(url)
-        records.append(EvidenceRecord(source_urls=[url], source_type="fetched"))
-
     for msg in messages:
-        if getattr(msg, "type", "") != "tool":
+        message_type, content = message_type_and_content(msg)
+        if message_type != "tool":
             continue
 
         call_id = str(getattr(msg, "tool_call_id", "") or "").strip()
         call = call_lookup.get(call_id, {})
         tool_name = str(getattr(msg, "name", "") or call.get("name") or "").strip()
-        if tool_name == think_tool.name:
+        if tool_name == _THINK_TOOL_NAME:
             continue
 
-        tool_text = stringify_tool_output(getattr(msg, "content", "")).strip()
         if tool_name == "fetch_url":
             fetch_arg_url = str(call.get("args", {}).get("url") or "").strip()
             if fetch_arg_url:
-                add_url(fetch_arg_url)
-                continue
-            if not tool_text:
+                # The requested URL is the evidence; skip coercing the (often huge) page body.
+                yield fetch_arg_url
                 continue
-            for raw_url in _URL_PATTERN.findall(tool_text):
-                add_url(raw_url)
+
+        tool_text = stringify_tool_output(content)
+        # Every accepted URL contains "://", so outputs without it (JSON blobs, filings) skip the regex scans.
+        if "://" not in tool_text:
             continue
 
         if tool_name == "search_web":
-            candidate_urls = _SEARCH_URL_LINE_PATTERN.findall(tool_text) if tool_text else []
-            if not candidate_urls and tool_text:
-                candidate_urls = _URL_PATTERN.findall(tool_text)
-            for raw_url in candidate_urls:
-                add_url(raw_url)
+            # Formatted search output always labels hits with "URL:"; anything else takes the generic scan.
+            urls = _SEARCH_URL_LINE_PATTERN.findall(tool_text) if "URL:" in tool_text else []
+            yield from urls or _URL_PATTERN.findall(tool_text)
             continue
 
-        # Defensive fallback for any future URL-returning research tools.
-        if not tool_text:
-            continue
-        for raw_url in _URL_PATTERN.findall(tool_text):
-            add_url(raw_url)
+        # fetch_url without a URL arg, plus a defensive fallback for future URL-returning tools.
+        yield from _URL_PATTERN.findall(tool_text)
 
-    return records
+
+def _extract_fetched_evidence_from_messages(messages: list[Any]) -> list[EvidenceRecord]:
+    """Extract URLs that came from actual search/fetch tool usage."""
+    # dict.fromkeys dedupes normalized URLs in first-seen order without a Python-level seen set.
+    unique_urls = dict.fromkeys(normalize_source_url(raw_url) for raw_url in _iter_tool_urls(messages))
+    return [
+        EvidenceRecord.model_construct(source_urls=[url], source_type="fetched")
+        for url in unique_urls
+        if is_http_source_url(url)
+    ]
 
 
 def extract_research_from_messages(result: dict) -> tuple[str | None, list[str], list[EvidenceRecord]]:
@@ -195,33 +218,23 @@ def extract_research_from_messages(result: dict) -> tuple[str | None, list[str],
     # The deep agent returns a full tool trace (search results, fetched page bodies, etc.)
     # but downstream supervisor/report prompts should only see the researcher's synthesized
     # write-up. Tool outputs can be extremely token-heavy (e.g., SEC filings), so we avoid
-    # folding them into notes.
-    ai_chunks: list[str] = []
-    for msg in messages:
-        if getattr(msg, "type", "") != "ai":
+    # folding them into notes. Only the last non-empty AI write-up is kept, so scan backwards.
+    raw_text = ""
+    for msg in reversed(messages):
+        message_type, content = message_type_and_content(msg)
+        if message_type != "ai":
             continue
-        content = stringify_tool_output(getattr(msg, "content", "")).strip()
-        if content:
-            ai_chunks.append(content)
-
-    raw_text = ai_chunks[-1].strip() if ai_chunks else ""
+        raw_text = stringify_tool_output(content)
+        if raw_text:
+            break
     fetched_evidence = _extract_fetched_evidence_from_messages(messages)
-    model_cited_evidence = _extract_evidence_records(raw_text, source_type="model_cited")
-    evidence_ledger = list(fetched_evidence)
-
-    seen_urls = {url for record in fetched_evidence for url in record.source_urls if _is_http_url(url)}
-    for record in model_cited_evidence:
-        urls = [url for url in record.source_urls if _is_http_url(url)]
-        if not urls:
-            continue
-        primary_url = urls[0]
-        if primary_url in seen_urls:
-            continue
-        seen_urls.add(primary_url)
-        evidence_ledger.append(record)
+    # Both extractors emit one validated URL per record, so model-cited URLs only need to skip fetched ones.
+    fetched_urls = {url for record in fetched_evidence for url in record.source_urls}
+    model_cited_evidence = _extract_evidence_records(raw_text, source_type="model_cited", skip_urls=fetched_urls)
+    evidence_ledger = [*fetched_evidence, *model_cited_evidence]
 
     raw_notes = [raw_text] if raw_text else []
     # Treat the researcher's final write-up as the "compressed" artifact for downstream use.
     # (Avoid lossy bulletization that can destroy structure/citations.)
-    compressed = state_text_or_none(raw_text)
+    compressed = raw_text or None
     return compressed, raw_notes, evidence_ledger
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import inspect
 import json
 import logging
@@ -16,21 +17,29 @@ from .config import runtime_event_logs_enabled
 _logger = logging.getLogger(__name__)
 
 
-def runnable_supports_config(callable_obj: Any) -> bool:
-    """Return whether a runnable call target accepts a `config` argument."""
+@functools.lru_cache(maxsize=256)
+def _signature_accepts_config(target: Any) -> bool:
     try:
-        parameters = inspect.signature(callable_obj).parameters.values()
+        parameters = inspect.signature(target).parameters.values()
     except (TypeError, ValueError):
         return True
-    has_var_kwargs = any(param.kind is inspect.Parameter.VAR_KEYWORD for param in parameters)
-    if has_var_kwargs:
-        return True
-    return any(param.name == "config" for param in parameters)
+    return any(param.kind is inspect.Parameter.VAR_KEYWORD or param.name == "config" for param in parameters)
+
+
+def runnable_supports_config(callable_obj: Any) -> bool:
+    """Return whether a runnable call target accepts a `config` argument."""
+    # Bound methods are rebuilt on every attribute access, so key the cache on the stable underlying
+    # function; a leading `self` parameter never changes the answer.
+    target = getattr(callable_obj, "__func__", callable_obj)
+    try:
+        return _signature_accepts_config(target)
+    except TypeError:  # unhashable callable
+        return _signature_accepts_config.__wrapped__(target)
 
 
 def log_runtime_event(logger: logging.Logger, event: str, **fields: Any) -> None:
     """Emit opt-in, structured runtime event logs."""
-    if not runtime_event_logs_enabled():
+    if not runtime_event_logs_enabled() or not logger.isEnabledFor(logging.INFO):
         return
 
     encoded_fields = " ".join(
@@ -44,8 +53,8 @@ def log_runtime_event(logger: logging.Logger, event: str, **fields: Any) -> None
 
 async def invoke_runnable_with_config(runnable: Any, payload: Any, config: RunnableConfig | None) -> Any:
     """Invoke a runnable while passing RunnableConfig when supported."""
-    if hasattr(runnable, "ainvoke"):
-        ainvoke = runnable.ainvoke
+    ainvoke = getattr(runnable, "ainvoke", None)
+    if ainvoke is not None:
         if config is not None and runnable_supports_config(ainvoke):
             return await ainvoke(payload, config=config)
         return await ainvoke(payload)
@@ -2,18 +2,20 @@
 
 from __future__ import annotations
 
+import functools
 import json
 import operator
 import re
+from collections.abc import Iterator, Sequence
 from datetime import datetime, timezone
-from typing import Annotated, Any, Literal, Sequence, TypedDict
+from typing import Annotated, Any, Literal, TypedDict, get_args
 
 from langchain_core.messages import AIMessage, BaseMessage
 from langgraph.graph import MessagesState
 from langgraph.graph.message import add_messages
-from pydantic import BaseModel, Field, ValidationError
+from pydantic import BaseModel, Field, ValidationError, field_validator
 
-from .message_utils import extract_text_content
+from .message_utils import extract_text_content, message_type_and_content
 
 FALLBACK_CLARIFY_QUESTION = "Before I start, can you clarify the scope so I can research the right thing?"
 FALLBACK_VERIFICATION = (
@@ -207,14 +209,53 @@ _SCOPE_UNIVERSE_MARKERS = {
     "s&p",
     "small cap",
 }
-_SCOPE_YEAR_PATTERN = re.compile(r"\b(?:19|20)\d{2}\b")
-_SCOPE_QUARTER_PATTERN = re.compile(r"\bq[1-4]\b")
-_SCOPE_MONTH_PATTERN = re.compile(
-    r"\b(?:jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|jun(?:e)?|jul(?:y)?|"
+_TOPIC_TOKEN_PATTERN = re.compile(r"[A-Za-z0-9']+")
+_NON_TOPIC_TOKEN_CHARS_PATTERN = re.compile(r"[^a-z0-9']+")
+# (suffix, replacement, token must be longer than) in priority order; the first applicable rule wins.
+_TOPIC_STEM_RULES = (
+    ("ies", "y", 0),
+    ("ing", "", 5),
+    ("ed", "", 4),
+    ("es", "", 4),
+    ("s", "", 3),
+)
+_TOPIC_STEM_SUFFIXES = ("s", "ing", "ed")
+_NOTE_BLOCK_SEPARATOR_PATTERN = re.compile(r"\n\n+")
+_WHITESPACE_RUN_PATTERN = re.compile(r"\s+")
+# Case-insensitive so provider error text (which can run to kilobytes) is never lowercased into a copy.
+_TOKEN_LIMIT_ERROR_PATTERN = re.compile(
+    r"context length|context window|maximum context|too many tokens|token limit|max tokens",
+    re.IGNORECASE,
+)
+_SCOPE_DATE_PATTERN_SOURCE = (
+    r"\b(?:19|20)\d{2}\b"
+    r"|\bq[1-4]\b"
+    r"|\b(?:jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|jun(?:e)?|jul(?:y)?|"
     r"aug(?:ust)?|sep(?:t(?:ember)?)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?)\b"
 )
 
 
+def _marker_alternation(markers: set[str]) -> str:
+    # Plain substring semantics, matching the `marker in text` checks these sets were built for.
+    return "|".join(re.escape(marker) for marker in sorted(markers, key=len, reverse=True))
+
+
+# Each scope check is one compiled scan instead of a Python-level substring probe per marker.
+_BROAD_SCOPE_NOUN_PATTERN = re.compile(_marker_alternation(_BROAD_SCOPE_NOUN_MARKERS))
+_BROAD_SCOPE_ACTION_PATTERN = re.compile(_marker_alternation(_BROAD_SCOPE_ACTION_MARKERS))
+_SCOPE_BOUNDARY_PATTERN = re.compile(
+    "|".join(
+        (
+            _SCOPE_DATE_PATTERN_SOURCE,
+            _marker_alternation(_SCOPE_TIMEFRAME_MARKERS),
+            _marker_alternation(_SCOPE_GEOGRAPHY_MARKERS),
+            r"\bus\b",
+            _marker_alternation(_SCOPE_UNIVERSE_MARKERS),
+        )
+    )
+)
+
+
 class ClarifyWithUser(BaseModel):
     """Structured decision for whether a clarification turn is needed."""
 
@@ -267,6 +308,21 @@ class ResearchComplete(BaseModel):
 
 
 EvidenceSourceType = Literal["fetched", "model_cited"]
+_URL_TRAILING_CHARS = " \t\n\r\f\v.,;"
+
+
+# Scheme + non-empty netloc is all validity needs, so skip full urlparse splitting.
+_HTTP_URL_SHAPE_PATTERN = re.compile(r"(?i)^https?://[^/\s?#]+")
+
+
+def normalize_source_url(raw_url: Any) -> str:
+    """Trim surrounding whitespace and trailing sentence punctuation from a cited URL."""
+    return str(raw_url).rstrip(_URL_TRAILING_CHARS).lstrip()
+
+
+def is_http_source_url(raw_url: Any) -> bool:
+    """Return whether a cited URL, once normalized, has an http(s) scheme and a host."""
+    return _HTTP_URL_SHAPE_PATTERN.match(normalize_source_url(raw_url)) is not None
 
 
 class EvidenceRecord(BaseModel):
@@ -281,6 +337,22 @@ class EvidenceRecord(BaseModel):
         description="Where this URL came from: fetched/search tool output or model-cited prose.",
     )
 
+    @field_validator("source_urls", mode="before")
+    @classmethod
+    def _normalize_source_urls(cls, value: Any) -> Any:
+        """Strip trailing punctuation and drop duplicate URLs once, at ingest."""
+        # Only all-str lists are normalized; anything else is left for the list[str] check to reject.
+        if not isinstance(value, (list, tuple)) or not all(isinstance(raw, str) for raw in value):
+            return value
+        return list(dict.fromkeys(url for url in map(normalize_source_url, value) if url))
+
+
+_EVIDENCE_FIELDS = frozenset(EvidenceRecord.model_fields)
+# Bound once so the per-item ledger loop does a single global load instead of a class attribute lookup.
+_construct_evidence_record = EvidenceRecord.model_construct
+_validate_evidence_record = EvidenceRecord.model_validate
+_EVIDENCE_SOURCE_TYPES = frozenset(get_args(EvidenceSourceType))
+
 
 class SupervisorState(TypedDict, total=False):
     """Supervisor state that coordinates multiple researcher delegations."""
@@ -324,108 +396,118 @@ def today_utc_date() -> str:
 
 def latest_human_text(messages: list[Any]) -> str:
     for message in reversed(messages):
-        if getattr(message, "type", "") == "human":
-            return extract_text_content(getattr(message, "content", "")).strip()
+        message_type, content = message_type_and_content(message)
+        if message_type == "human":
+            return extract_text_content(content).strip()
     return ""
 
 
+def iter_human_texts(messages: list[Any]) -> Iterator[str]:
+    """Yield each human message's text in chronological order, decoding lazily."""
+    for message_type, content in map(message_type_and_content, messages):
+        if message_type == "human":
+            yield extract_text_content(content).strip()
+
+
 def human_texts(messages: list[Any]) -> list[str]:
     """Return all human messages in chronological order."""
-    return [
-        extract_text_content(getattr(message, "content", "")).strip()
-        for message in messages
-        if getattr(message, "type", "") == "human"
-    ]
+    return list(iter_human_texts(messages))
+
+
+def _latest_human_texts(messages: list[Any], count: int) -> list[str]:
+    """Return the last `count` non-empty human texts in chronological order, decoding only those turns."""
+    texts: list[str] = []
+    for message_type, content in map(message_type_and_content, reversed(messages)):
+        if message_type != "human":
+            continue
+        text = extract_text_content(content).strip()
+        if text:
+            texts.append(text)
+            if len(texts) == count:
+                break
+    texts.reverse()
+    return texts
 
 
+@functools.lru_cache(maxsize=4096)
 def normalize_topic_token(token: str) -> str:
     """Normalize a token for lightweight intent comparison."""
-    cleaned = re.sub(r"[^a-z0-9']+", "", token.lower())
+    cleaned = _NON_TOPIC_TOKEN_CHARS_PATTERN.sub("", token.lower())
     if len(cleaned) <= 2 or cleaned in STOP_TOKENS:
         return ""
-    if cleaned.endswith("ies"):
-        cleaned = cleaned[:-3] + "y"
-    elif cleaned.endswith("ing") and len(cleaned) > 5:
-        cleaned = cleaned[:-3]
-    elif cleaned.endswith("ed") and len(cleaned) > 4:
-        cleaned = cleaned[:-2]
-    elif cleaned.endswith("es") and len(cleaned) > 4:
-        cleaned = cleaned[:-2]
-    elif cleaned.endswith("s") and len(cleaned) > 3:
-        cleaned = cleaned[:-1]
+    # One tuple endswith settles the common no-suffix case before walking the rule table.
+    if not cleaned.endswith(_TOPIC_STEM_SUFFIXES):
+        return cleaned
+    for suffix, replacement, min_length in _TOPIC_STEM_RULES:
+        if len(cleaned) > min_length and cleaned.endswith(suffix):
+            return cleaned[: -len(suffix)] + replacement
     return cleaned
 
 
-def tokenize_for_intent(text: str) -> set[str]:
+@functools.lru_cache(maxsize=256)
+def tokenize_for_intent(text: str) -> frozenset[str]:
     """Tokenize normalized user text for lightweight intent comparison."""
-    return {token for token in (normalize_topic_token(raw) for raw in re.findall(r"[A-Za-z0-9']+", text)) if token}
+    # Follow-up checks re-tokenize the same recent human turns every graph step, so results are cached.
+    return frozenset(
+        token for token in (normalize_topic_token(raw) for raw in _TOPIC_TOKEN_PATTERN.findall(text)) if token
+    )
 
 
 def should_recheck_intent_on_follow_up(messages: list[Any]) -> bool:
     """Decide whether a follow-up turn likely shifts intent."""
-    messages_text = [text for text in human_texts(messages) if text]
+    messages_text = _latest_human_texts(messages, 2)
     if len(messages_text) < 2:
         return False
 
-    latest = messages_text[-1]
-    previous = messages_text[-2]
+    previous, latest = messages_text
     latest_tokens = tokenize_for_intent(latest)
     previous_tokens = tokenize_for_intent(previous)
     if not latest_tokens or not previous_tokens:
         return False
 
-    overlapping_tokens = latest_tokens & previous_tokens
-    if overlapping_tokens:
+    # isdisjoint answers each overlap question without materializing an intersection set.
+    if not latest_tokens.isdisjoint(previous_tokens):
         # Only force a shift recheck on explicit switch language. Common words like
         # "new" should not trigger clarification if topic overlap is clear.
-        if latest_tokens & STRONG_FOLLOW_UP_SHIFT_MARKERS:
-            return True
-        return False
-    if any(marker in latest_tokens for marker in FOLLOW_UP_CONTINUATION_MARKERS):
-        return False
-    if latest_tokens & FOLLOW_UP_SHIFT_MARKERS:
-        return True
-
-    return True
+        return not latest_tokens.isdisjoint(STRONG_FOLLOW_UP_SHIFT_MARKERS)
+    # No topic overlap: recheck unless the turn reads as a continuation. Explicit shift markers
+    # (FOLLOW_UP_SHIFT_MARKERS) lead to the same answer, so they need no separate probe.
+    return latest_tokens.isdisjoint(FOLLOW_UP_CONTINUATION_MARKERS)
 
 
 def _joined_human_text(messages: list[Any]) -> str:
-    return " ".join(text.lower() for text in human_texts(messages) if text)
+    return " ".join(text.lower() for text in iter_human_texts(messages) if text)
+
+
+def _is_broad_scope_text(text: str) -> bool:
+    if _BROAD_SCOPE_NOUN_PATTERN.search(text) is None:
+        return False
+    return _BROAD_SCOPE_ACTION_PATTERN.search(text) is not None
+
+
+def _has_scope_boundary_text(text: str) -> bool:
+    # Timeframe, geography, and market-universe markers all count, so one fused scan answers the question.
+    return _SCOPE_BOUNDARY_PATTERN.search(text) is not None
 
 
 def is_broad_scope_request(messages: list[Any]) -> bool:
     """Heuristic for broad asks that should be scoped before research starts."""
     text = _joined_human_text(messages)
-    if not text:
-        return False
-    has_broad_noun = any(marker in text for marker in _BROAD_SCOPE_NOUN_MARKERS)
-    if not has_broad_noun:
-        return False
-    return any(marker in text for marker in _BROAD_SCOPE_ACTION_MARKERS)
+    return bool(text) and _is_broad_scope_text(text)
 
 
 def has_scope_boundary(messages: list[Any]) -> bool:
     """Return whether user messages include a concrete research boundary."""
     text = _joined_human_text(messages)
-    if not text:
-        return False
-
-    has_timeframe = (
-        bool(_SCOPE_YEAR_PATTERN.search(text))
-        or bool(_SCOPE_QUARTER_PATTERN.search(text))
-        or bool(_SCOPE_MONTH_PATTERN.search(text))
-        or any(marker in text for marker in _SCOPE_TIMEFRAME_MARKERS)
-    )
-    if has_timeframe:
-        return True
+    return bool(text) and _has_scope_boundary_text(text)
 
-    has_geography = any(marker in text for marker in _SCOPE_GEOGRAPHY_MARKERS)
-    if not has_geography and re.search(r"\bus\b", text):
-        has_geography = True
-    if has_geography:
-        return True
 
-    return any(marker in text for marker in _SCOPE_UNIVERSE_MARKERS)
+def classify_scope(messages: list[Any]) -> tuple[bool, bool]:
+    """Return `(is_broad_scope_request, has_scope_boundary)` from a single join of the human turns."""
+    text = _joined_human_text(messages)
+    if not text:
+        return False, False
+    return _is_broad_scope_text(text), _has_scope_boundary_text(text)
 
 
 def state_text_or_none(value: Any) -> str | None:
@@ -451,6 +533,29 @@ def normalize_note_list(value: Any) -> list[str]:
     return [text] if text else []
 
 
+def has_note_text(value: Any) -> bool:
+    """Return whether `normalize_note_list(value)` would keep any note, stopping at the first one."""
+    if isinstance(value, list):
+        return any(state_text_or_none(item) for item in value)
+    return state_text_or_none(value) is not None
+
+
+def _is_canonical_evidence_dict(item: dict[str, Any]) -> bool:
+    # Dumped records (checkpoints, subgraph outputs) already have validated shape; anything else is validated.
+    if not item.keys() <= _EVIDENCE_FIELDS:
+        return False
+    # Exact-type guard first: an unhashable source_type must reach model_validate, not raise on the set probe.
+    source_type = item.get("source_type", "fetched")
+    if type(source_type) is not str or source_type not in _EVIDENCE_SOURCE_TYPES:
+        return False
+    urls = item.get("source_urls", [])
+    return (
+        type(urls) is list
+        and all(type(url) is str and url and normalize_source_url(url) == url for url in urls)
+        and len(set(urls)) == len(urls)
+    )
+
+
 def normalize_evidence_ledger(value: Any) -> list[EvidenceRecord]:
     """Normalize evidence ledger values into validated EvidenceRecord items."""
     if value is None:
@@ -468,8 +573,11 @@ def normalize_evidence_ledger(value: Any) -> list[EvidenceRecord]:
             normalized.append(item)
             continue
         if isinstance(item, dict):
+            if _is_canonical_evidence_dict(item):
+                normalized.append(_construct_evidence_record(**item))
+                continue
             try:
-                normalized.append(EvidenceRecord.model_validate(item))
+                normalized.append(_validate_evidence_record(item))
             except ValidationError:
                 continue
             continue
@@ -497,16 +605,7 @@ def join_note_list(values: Any) -> str | None:
 
 def is_token_limit_error(exc: Exception) -> bool:
     """Best-effort check for context/token limit failures across providers."""
-    message = str(exc).lower()
-    token_markers = (
-        "context length",
-        "context window",
-        "maximum context",
-        "too many tokens",
-        "token limit",
-        "max tokens",
-    )
-    return any(marker in message for marker in token_markers)
+    return _TOKEN_LIMIT_ERROR_PATTERN.search(str(exc)) is not None
 
 
 def latest_ai_message(messages: list[Any]) -> AIMessage | None:
@@ -516,23 +615,41 @@ def latest_ai_message(messages: list[Any]) -> AIMessage | None:
     return None
 
 
+def _stringify_text_output(output: str) -> str:
+    return output.strip()
+
+
+def _stringify_list_output(output: list[Any]) -> str:
+    return "\n".join(filter(None, (extract_text_content(item).strip() for item in output)))
+
+
+def _stringify_dict_output(output: dict[Any, Any]) -> str:
+    if "content" in output:
+        return extract_text_content(output.get("content", "")).strip()
+    try:
+        return json.dumps(output, ensure_ascii=True)
+    except TypeError:
+        return str(output)
+
+
+# Exact-type dispatch for the common tool payloads; subclasses fall through to the isinstance checks.
+_TOOL_OUTPUT_STRINGIFIERS = {
+    str: _stringify_text_output,
+    list: _stringify_list_output,
+    dict: _stringify_dict_output,
+}
+
+
 def stringify_tool_output(output: Any) -> str:
+    stringify = _TOOL_OUTPUT_STRINGIFIERS.get(type(output))
+    if stringify is not None:
+        return stringify(output)
     if isinstance(output, str):
-        return output.strip()
+        return _stringify_text_output(output)
     if isinstance(output, list):
-        lines: list[str] = []
-        for item in output:
-            text = extract_text_content(item).strip()
-            if text:
-                lines.append(text)
-        return "\n".join(lines)
+        return _stringify_list_output(output)
     if isinstance(output, dict):
-        if "content" in output:
-            return extract_text_content(output.get("content", "")).strip()
-        try:
-            return json.dumps(output, ensure_ascii=True)
-        except TypeError:
-            return str(output)
+        return _stringify_dict_output(output)
     return extract_text_content(getattr(output, "content", output)).strip()
 
 
@@ -541,19 +658,17 @@ def compress_note_text(raw_text: str | None) -> str | None:
     if not text:
         return None
 
-    candidates: list[str] = []
-    seen: set[str] = set()
-    for block in re.split(r"\n\n+", text):
-        normalized = re.sub(r"\s+", " ", block).strip()
+    # One bullet per unique paragraph, keyed case-insensitively; insertion order keeps the first spelling.
+    bullets: dict[str, str] = {}
+    for block in _NOTE_BLOCK_SEPARATOR_PATTERN.split(text):
+        normalized = _WHITESPACE_RUN_PATTERN.sub(" ", block).strip()
         if not normalized:
             continue
         dedupe_key = normalized.lower()
-        if dedupe_key in seen:
-            continue
-        seen.add(dedupe_key)
-        candidates.append(normalized)
+        if dedupe_key not in bullets:
+            bullets[dedupe_key] = f"- {normalized}"
 
-    if not candidates:
+    if not bullets:
         return None
-
-    return "\n".join(f"- {item}" for item in candidates).strip()
+    # Every bullet is stripped and non-empty, so the joined text needs no trailing strip.
+    return "\n".join(bullets.values())
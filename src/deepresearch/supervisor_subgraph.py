@@ -3,14 +3,15 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
 import re
+import weakref
 from typing import Any, Literal
 from urllib.parse import urlparse
 
 from langchain_core.callbacks.manager import adispatch_custom_event
 from langchain_core.messages import AIMessage, HumanMessage, SystemMessage, ToolMessage
-from langchain_core.messages.utils import convert_to_messages
 from langchain_core.runnables.config import RunnableConfig
 from langgraph.graph import END, START, StateGraph
 from langgraph.types import Command, Send
@@ -20,6 +21,7 @@ from .config import (
     get_max_concurrent_research_units,
     get_max_researcher_iterations,
 )
+from .message_utils import coerce_messages, latest_raw_ai_message
 from .nodes import think_tool
 from .prompts import SUPERVISOR_PROMPT
 from .researcher_subgraph import build_researcher_subgraph, extract_research_from_messages
@@ -31,10 +33,9 @@ from .state import (
     ResearchComplete,
     SupervisorState,
     filter_evidence_ledger,
+    has_note_text,
     join_note_list,
-    latest_ai_message,
     normalize_evidence_ledger,
-    normalize_note_list,
     state_text_or_none,
     stringify_tool_output,
     today_utc_date,
@@ -43,29 +44,87 @@ from .state import (
 _logger = logging.getLogger(__name__)
 _RECURSION_LIMIT_PATTERN = re.compile(r"Recursion limit of \d+ reached")
 _SUPERVISOR_PROGRESS_EVENT = "supervisor_progress"
+_THINK_TOOL_NAME = think_tool.name
+_CONDUCT_RESEARCH_NAME = ConductResearch.__name__
+_RESEARCH_COMPLETE_NAME = ResearchComplete.__name__
+# Bucket order for _partition_tool_calls: think, research, complete.
+_SUPERVISOR_TOOL_NAMES = (_THINK_TOOL_NAME, _CONDUCT_RESEARCH_NAME, _RESEARCH_COMPLETE_NAME)
+_SUPERVISOR_TOOLS = (ConductResearch, ResearchComplete, think_tool)
+# Fixed-shape tool replies are copied from validated templates; model_copy skips re-running pydantic validation.
+_SKIPPED_RESEARCH_TEMPLATE = ToolMessage(content="", name=_CONDUCT_RESEARCH_NAME, tool_call_id="")
+_RESEARCH_COMPLETE_TEMPLATE = ToolMessage(
+    content="[ResearchComplete received]",
+    name=_RESEARCH_COMPLETE_NAME,
+    tool_call_id="",
+)
+_bound_supervisor_model: tuple[Any, Any] | None = None
+# Research units queue on a per-loop semaphore instead of being dropped past the concurrency cap.
+_research_unit_semaphores: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, tuple[int, asyncio.Semaphore]] = (
+    weakref.WeakKeyDictionary()
+)
 
 
-def render_supervisor_prompt(current_date: str) -> str:
+def _tool_message_from_template(template: ToolMessage, **update: Any) -> ToolMessage:
+    # model_copy is shallow, so each reply gets its own metadata dicts instead of sharing the template's.
+    return template.model_copy(update={"additional_kwargs": {}, "response_metadata": {}, **update})
+
+
+@functools.lru_cache(maxsize=8)
+def _render_supervisor_prompt_cached(
+    current_date: str,
+    max_concurrent_research_units: int,
+    max_researcher_iterations: int,
+) -> str:
     return SUPERVISOR_PROMPT.format(
         current_date=current_date,
-        max_concurrent_research_units=get_max_concurrent_research_units(),
-        max_researcher_iterations=get_max_researcher_iterations(),
+        max_concurrent_research_units=max_concurrent_research_units,
+        max_researcher_iterations=max_researcher_iterations,
     )
 
 
+def render_supervisor_prompt(current_date: str) -> str:
+    # Caps are read per call so config changes still apply; only the template render is memoized.
+    return _render_supervisor_prompt_cached(
+        current_date,
+        get_max_concurrent_research_units(),
+        get_max_researcher_iterations(),
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _supervisor_system_message(prompt: str) -> SystemMessage:
+    # The rendered prompt only changes with the date or caps, so planning turns share one message instance.
+    return SystemMessage(content=prompt)
+
+
 def compute_research_dispatch_counts(
     *,
     requested_research_units: int,
     research_iterations: int,
 ) -> tuple[int, int]:
-    """Return runnable-research count and remaining iteration budget."""
+    """Return runnable-research count and remaining iteration budget.
+
+    Concurrency is enforced when units run (see `_research_unit_semaphore`), so only the
+    iteration budget limits how many calls are dispatched.
+    """
     bounded_requested = _coerce_non_negative_int(requested_research_units)
     bounded_iterations = _coerce_non_negative_int(research_iterations)
     remaining_iterations = max(0, get_max_researcher_iterations() - bounded_iterations)
-    dispatch_count = min(bounded_requested, get_max_concurrent_research_units(), remaining_iterations)
+    dispatch_count = min(bounded_requested, remaining_iterations)
     return dispatch_count, remaining_iterations
 
 
+def _research_unit_semaphore() -> asyncio.Semaphore:
+    """Return the running loop's semaphore bounding in-flight research units."""
+    loop = asyncio.get_running_loop()
+    limit = get_max_concurrent_research_units()
+    cached = _research_unit_semaphores.get(loop)
+    if cached is None or cached[0] != limit:
+        # A changed cap gets a fresh semaphore; units already holding the old one finish undisturbed.
+        cached = _research_unit_semaphores[loop] = (limit, asyncio.Semaphore(limit))
+    return cached[1]
+
+
 def _normalize_tool_calls(raw_tool_calls: Any) -> list[dict[str, Any]]:
     if not isinstance(raw_tool_calls, list):
         return []
@@ -85,19 +144,16 @@ def _normalize_tool_calls(raw_tool_calls: Any) -> list[dict[str, Any]]:
     return normalized
 
 
-def _latest_supervisor_tool_calls(state: SupervisorState) -> list[dict[str, Any]]:
-    supervisor_messages = list(convert_to_messages(state.get("supervisor_messages", [])))
-    latest_ai = latest_ai_message(supervisor_messages)
-    if latest_ai is None:
-        return []
-    return _normalize_tool_calls(getattr(latest_ai, "tool_calls", None))
+def _has_tool_calls(raw_tool_calls: Any) -> bool:
+    """Return whether `_normalize_tool_calls` would keep any call, without building the normalized list."""
+    return isinstance(raw_tool_calls, list) and any(isinstance(raw_call, dict) for raw_call in raw_tool_calls)
 
 
 def _has_any_tool_calls(messages: list[Any]) -> bool:
     for message in messages:
         if getattr(message, "type", "") != "ai":
             continue
-        if _normalize_tool_calls(getattr(message, "tool_calls", None)):
+        if _has_tool_calls(getattr(message, "tool_calls", None)):
             return True
     return False
 
@@ -115,8 +171,9 @@ def _extract_source_domains(evidence_ledger: list[EvidenceRecord]) -> list[str]:
 
 def _dedupe_evidence_records(evidence_ledger: list[EvidenceRecord]) -> list[EvidenceRecord]:
     """URL-level dedupe that prefers fetched provenance over model-cited."""
+    # Input records are already validated, so single-URL records are built without re-validation.
+    # Re-assigning an existing key keeps its first-seen position, so the dict doubles as the URL order.
     by_url: dict[str, EvidenceRecord] = {}
-    ordered_urls: list[str] = []
 
     for record in evidence_ledger:
         source_type = "fetched" if record.source_type == "fetched" else "model_cited"
@@ -125,14 +182,10 @@ def _dedupe_evidence_records(evidence_ledger: list[EvidenceRecord]) -> list[Evid
             if not url:
                 continue
             existing = by_url.get(url)
-            if existing is None:
-                by_url[url] = EvidenceRecord(source_urls=[url], source_type=source_type)
-                ordered_urls.append(url)
-                continue
-            if existing.source_type != "fetched" and source_type == "fetched":
-                by_url[url] = EvidenceRecord(source_urls=[url], source_type="fetched")
+            if existing is None or (existing.source_type != "fetched" and source_type == "fetched"):
+                by_url[url] = EvidenceRecord.model_construct(source_urls=[url], source_type=source_type)
 
-    return [by_url[url] for url in ordered_urls]
+    return list(by_url.values())
 
 
 def _sanitize_research_unit_failure(exc: Exception) -> str:
@@ -165,11 +218,10 @@ def _prepare_reset_payload() -> dict[str, Any]:
 
 
 def _latest_ai_with_tool_calls(state: SupervisorState) -> AIMessage | None:
-    supervisor_messages = list(convert_to_messages(state.get("supervisor_messages", [])))
-    latest_ai = latest_ai_message(supervisor_messages)
+    latest_ai = latest_raw_ai_message(state.get("supervisor_messages"))
     if latest_ai is None:
         return None
-    if not _normalize_tool_calls(getattr(latest_ai, "tool_calls", None)):
+    if not _has_tool_calls(getattr(latest_ai, "tool_calls", None)):
         return None
     return latest_ai
 
@@ -177,87 +229,85 @@ def _latest_ai_with_tool_calls(state: SupervisorState) -> AIMessage | None:
 def _partition_tool_calls(
     tool_calls: list[dict[str, Any]],
 ) -> tuple[list[dict[str, Any]], list[dict[str, Any]], list[dict[str, Any]]]:
-    think_calls = [call for call in tool_calls if call.get("name") == think_tool.name]
-    research_calls = [call for call in tool_calls if call.get("name") == ConductResearch.__name__]
-    complete_calls = [call for call in tool_calls if call.get("name") == ResearchComplete.__name__]
+    buckets: dict[str, list[dict[str, Any]]] = {name: [] for name in _SUPERVISOR_TOOL_NAMES}
+    # One pass buckets each call by name; unknown tool names are dropped, as before.
+    for call in tool_calls:
+        bucket = buckets.get(call.get("name"))
+        if bucket is not None:
+            bucket.append(call)
+    think_calls, research_calls, complete_calls = buckets.values()
     return think_calls, research_calls, complete_calls
 
 
-async def _run_think_calls(think_calls: list[dict[str, Any]]) -> list[ToolMessage]:
-    tool_messages: list[ToolMessage] = []
-    for index, call in enumerate(think_calls):
-        args = call.get("args") if isinstance(call.get("args"), dict) else {}
-        content = await invoke_single_tool(think_tool, args)
-        tool_messages.append(
-            ToolMessage(
-                content=content or "[No reflection recorded]",
-                name=think_tool.name,
-                tool_call_id=str(call.get("id") or f"supervisor_think_{index}"),
-            )
+def _run_think_calls(think_calls: list[dict[str, Any]]) -> list[ToolMessage]:
+    call_args = [call.get("args") if isinstance(call.get("args"), dict) else {} for call in think_calls]
+    # think_tool is a sync reflection echo with no I/O; invoking it inline skips ainvoke's executor thread hop per call.
+    contents = [stringify_tool_output(think_tool.invoke(args)) for args in call_args]
+    return [
+        ToolMessage(
+            content=content or "[No reflection recorded]",
+            name=_THINK_TOOL_NAME,
+            tool_call_id=str(call.get("id") or f"supervisor_think_{index}"),
         )
-    return tool_messages
+        for index, (call, content) in enumerate(zip(think_calls, contents, strict=True))
+    ]
 
 
 def _prepare_research_calls(
     runnable_research_calls: list[dict[str, Any]],
 ) -> list[dict[str, Any]]:
-    prepared_research_calls: list[dict[str, Any]] = []
-    for index, call in enumerate(runnable_research_calls):
-        args = call.get("args") if isinstance(call.get("args"), dict) else {}
-        prepared_research_calls.append(
-            {
-                "id": str(call.get("id") or f"supervisor_research_{index}"),
-                "args": args,
-                "topic": state_text_or_none(args.get("research_topic")) or "",
-            }
-        )
-    return prepared_research_calls
+    return [
+        {
+            "id": str(call.get("id") or f"supervisor_research_{index}"),
+            "args": args,
+            "topic": state_text_or_none(args.get("research_topic")) or "",
+        }
+        for index, call in enumerate(runnable_research_calls)
+        for args in (call.get("args") if isinstance(call.get("args"), dict) else {},)
+    ]
 
 
 def _prepare_complete_call_payloads(complete_calls: list[dict[str, Any]]) -> list[dict[str, Any]]:
-    complete_call_payloads: list[dict[str, Any]] = []
-    for index, call in enumerate(complete_calls):
-        complete_call_payloads.append(
-            {
-                "id": str(call.get("id") or f"supervisor_complete_{index}"),
-            }
-        )
-    return complete_call_payloads
+    return [{"id": str(call.get("id") or f"supervisor_complete_{index}")} for index, call in enumerate(complete_calls)]
 
 
 def _build_skipped_research_messages(
     skipped_research_calls: list[dict[str, Any]],
     remaining_iterations: int,
 ) -> tuple[list[ToolMessage], list[dict[str, Any]]]:
-    tool_messages: list[ToolMessage] = []
-    skipped_summaries: list[dict[str, Any]] = []
-    max_concurrent_research_units = get_max_concurrent_research_units()
-    for index, call in enumerate(skipped_research_calls):
-        args = call.get("args") if isinstance(call.get("args"), dict) else {}
-        topic = state_text_or_none(args.get("research_topic")) or ""
-        tool_call_id = str(call.get("id") or f"supervisor_research_skipped_{index}")
-        tool_messages.append(
-            ToolMessage(
-                content=(
-                    "[ConductResearch skipped: reached runtime cap "
-                    f"(max_concurrent_research_units={max_concurrent_research_units}, "
-                    f"remaining_iterations={remaining_iterations})]"
-                ),
-                name=ConductResearch.__name__,
-                tool_call_id=tool_call_id,
-            )
-        )
-        skipped_summaries.append(
-            {
-                "call_id": tool_call_id,
-                "topic": topic,
-                "status": "skipped",
-                "failure_reason": "reached runtime cap",
-                "evidence_record_count": 0,
-                "source_domain_count": 0,
-                "duration_seconds": 0.0,
-            }
+    if not skipped_research_calls:
+        # Most cycles skip nothing; don't re-read the cap just to format text nobody will see.
+        return [], []
+    max_researcher_iterations = get_max_researcher_iterations()
+    # Every skipped call shares the same cap text; ids and topics are resolved once and reused by both lists.
+    skip_content = (
+        "[ConductResearch skipped: reached runtime cap "
+        f"(max_researcher_iterations={max_researcher_iterations}, "
+        f"remaining_iterations={remaining_iterations})]"
+    )
+    skipped_calls = [
+        (
+            str(call.get("id") or f"supervisor_research_skipped_{index}"),
+            state_text_or_none(args.get("research_topic")) if isinstance(args := call.get("args"), dict) else None,
         )
+        for index, call in enumerate(skipped_research_calls)
+    ]
+    tool_messages = [
+        _tool_message_from_template(_SKIPPED_RESEARCH_TEMPLATE, content=skip_content, tool_call_id=tool_call_id)
+        for tool_call_id, _topic in skipped_calls
+    ]
+    skipped_summaries = [
+        {
+            "call_id": tool_call_id,
+            "topic": topic or "",
+            "status": "skipped",
+            "failure_reason": "reached runtime cap",
+            "evidence_record_count": 0,
+            "source_domain_count": 0,
+            "duration_seconds": 0.0,
+        }
+        for tool_call_id, topic in skipped_calls
+    ]
     return tool_messages, skipped_summaries
 
 
@@ -283,21 +333,31 @@ def _build_prepare_update(
     }
 
 
+def _bind_supervisor_tools(model: Any) -> Any:
+    # get_llm reuses model instances, so keep the last binding instead of re-serializing tool schemas every turn.
+    global _bound_supervisor_model
+    if not hasattr(model, "bind_tools"):
+        return model
+    if _bound_supervisor_model is not None and _bound_supervisor_model[0] is model:
+        return _bound_supervisor_model[1]
+    bound_model = model.bind_tools(list(_SUPERVISOR_TOOLS))
+    _bound_supervisor_model = (model, bound_model)
+    return bound_model
+
+
 async def supervisor(state: SupervisorState, config: RunnableConfig = None) -> dict[str, Any]:
     """Supervisor planning node with tool selection."""
-    supervisor_messages = list(convert_to_messages(state.get("supervisor_messages", [])))
+    supervisor_messages = coerce_messages(state.get("supervisor_messages"))
     research_brief = state_text_or_none(state.get("research_brief"))
     if not supervisor_messages and research_brief:
         supervisor_messages = [HumanMessage(content=research_brief)]
 
     model_messages = [
-        SystemMessage(content=render_supervisor_prompt(current_date=today_utc_date())),
+        _supervisor_system_message(render_supervisor_prompt(current_date=today_utc_date())),
         *supervisor_messages,
     ]
 
-    model = get_llm("orchestrator")
-    if hasattr(model, "bind_tools"):
-        model = model.bind_tools([ConductResearch, ResearchComplete, think_tool])
+    model = _bind_supervisor_tools(get_llm("orchestrator"))
 
     try:
         response = await invoke_runnable_with_config(model, model_messages, config)
@@ -347,7 +407,7 @@ async def supervisor_prepare(state: SupervisorState, config: RunnableConfig = No
         complete_calls=len(complete_calls),
     )
 
-    think_messages = await _run_think_calls(think_calls)
+    think_messages = _run_think_calls(think_calls)
 
     dispatch_count, remaining_iterations = compute_research_dispatch_counts(
         requested_research_units=len(research_calls),
@@ -432,7 +492,7 @@ async def run_research_unit(state: dict[str, Any]) -> dict[str, Any]:
             "supervisor_messages": [
                 ToolMessage(
                     content="[ConductResearch missing research_topic]",
-                    name=ConductResearch.__name__,
+                    name=_CONDUCT_RESEARCH_NAME,
                     tool_call_id=call_id,
                 )
             ],
@@ -462,16 +522,20 @@ async def run_research_unit(state: dict[str, Any]) -> dict[str, Any]:
         return _missing_topic_result(call_id, round(loop.time() - started_at, 3))
 
     researcher_graph = build_researcher_subgraph()
-    payload = {"messages": [HumanMessage(content=topic)]}
+    # `topic` is already a stripped non-empty str, so the seed message needs no validation pass.
+    payload = {"messages": [HumanMessage.model_construct(content=topic)]}
     try:
-        result = await researcher_graph.ainvoke(payload)
+        async with _research_unit_semaphore():
+            # Timed from acquiring a slot, so units queued behind the concurrency cap don't report the wait.
+            started_at = loop.time()
+            result = await researcher_graph.ainvoke(payload)
     except Exception as exc:  # pragma: no cover - defensive guard
         failure_reason = _sanitize_research_unit_failure(exc)
         return {
             "supervisor_messages": [
                 ToolMessage(
                     content=f"[Research unit failed: {failure_reason}]",
-                    name=ConductResearch.__name__,
+                    name=_CONDUCT_RESEARCH_NAME,
                     tool_call_id=call_id,
                 )
             ],
@@ -501,7 +565,7 @@ async def run_research_unit(state: dict[str, Any]) -> dict[str, Any]:
         "supervisor_messages": [
             ToolMessage(
                 content=content,
-                name=ConductResearch.__name__,
+                name=_CONDUCT_RESEARCH_NAME,
                 tool_call_id=call_id,
             )
         ],
@@ -550,7 +614,13 @@ async def supervisor_finalize(state: SupervisorState, config: RunnableConfig = N
     model_cited_domains = _extract_source_domains(model_cited_evidence)
 
     completed = bool(complete_calls)
-    tool_messages: list[ToolMessage] = []
+    tool_messages = [
+        _tool_message_from_template(
+            _RESEARCH_COMPLETE_TEMPLATE,
+            tool_call_id=str(call.get("id") or f"supervisor_complete_{index}"),
+        )
+        for index, call in enumerate(complete_calls)
+    ]
     if complete_calls:
         log_runtime_event(
             _logger,
@@ -560,14 +630,6 @@ async def supervisor_finalize(state: SupervisorState, config: RunnableConfig = N
             model_cited_record_count=len(model_cited_evidence),
             model_cited_domain_count=len(model_cited_domains),
         )
-        for index, call in enumerate(complete_calls):
-            tool_messages.append(
-                ToolMessage(
-                    content="[ResearchComplete received]",
-                    name=ResearchComplete.__name__,
-                    tool_call_id=str(call.get("id") or f"supervisor_complete_{index}"),
-                )
-            )
 
     if completed:
         log_runtime_event(_logger, "supervisor_completion", research_iterations=research_iterations)
@@ -628,7 +690,8 @@ def supervisor_route(state: SupervisorState) -> Literal["supervisor_prepare", "s
     if _coerce_non_negative_int(state.get("research_iterations", 0)) >= get_max_researcher_iterations():
         return "supervisor_terminal"
 
-    return "supervisor_prepare" if _latest_supervisor_tool_calls(state) else "supervisor_terminal"
+    # Routers run on every edge, so only probe the newest AI message instead of normalizing its calls.
+    return "supervisor_prepare" if _latest_ai_with_tool_calls(state) is not None else "supervisor_terminal"
 
 
 def supervisor_finalize_route(state: SupervisorState) -> Literal["supervisor", "supervisor_terminal"]:
@@ -644,13 +707,13 @@ def supervisor_finalize_route(state: SupervisorState) -> Literal["supervisor", "
 
 async def supervisor_terminal(state: SupervisorState) -> dict[str, Any]:
     """Finalize the supervisor run and emit deterministic fallback when needed."""
-    supervisor_messages = list(convert_to_messages(state.get("supervisor_messages", [])))
+    supervisor_messages = coerce_messages(state.get("supervisor_messages"))
     supervisor_exception = state_text_or_none(state.get("supervisor_exception"))
     research_iterations = _coerce_non_negative_int(state.get("research_iterations", 0))
     max_iterations = get_max_researcher_iterations()
 
     has_tool_calls = _has_any_tool_calls(supervisor_messages)
-    has_any_notes = bool(normalize_note_list(state.get("notes"))) or bool(normalize_note_list(state.get("raw_notes")))
+    has_any_notes = has_note_text(state.get("notes")) or has_note_text(state.get("raw_notes"))
     has_any_evidence = bool(normalize_evidence_ledger(state.get("evidence_ledger")))
 
     # Log termination reason for observability
@@ -691,8 +754,10 @@ async def supervisor_terminal(state: SupervisorState) -> dict[str, Any]:
     }
 
 
+@functools.lru_cache(maxsize=1)
 def build_supervisor_subgraph():
     """Build the native supervisor loop with Send-based research fan-out."""
+    # Nodes resolve models, caps, and the researcher graph at run time, so one compiled loop serves every app.
     builder = StateGraph(SupervisorState)
     builder.add_node("supervisor", supervisor)
     builder.add_node("supervisor_prepare", supervisor_prepare)
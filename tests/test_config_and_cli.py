@@ -43,6 +43,29 @@ def test_get_llm_passes_resolved_model(monkeypatch):
     assert captured["kwargs"] == {"model": "openai:gpt-test-mini"}
 
 
+def test_get_llm_reuses_model_until_credentials_change(monkeypatch):
+    built = []
+
+    def fake_init_chat_model(**kwargs):
+        built.append(kwargs)
+        return object()
+
+    monkeypatch.setattr(config, "init_chat_model", fake_init_chat_model)
+    monkeypatch.setenv("SUBAGENT_MODEL", "openai:gpt-test-mini")
+    monkeypatch.setenv("OPENAI_USE_RESPONSES_API", "false")
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-old")
+
+    first = config.get_llm("subagent")
+    assert config.get_llm("subagent") is first
+
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-new")
+    rotated = config.get_llm("subagent")
+    assert rotated is not first
+    monkeypatch.setenv("OPENAI_BASE_URL", "https://proxy.example.com/v1")
+    assert config.get_llm("subagent") is not rotated
+    assert len(built) == 3
+
+
 def test_openai_responses_api_defaults_enabled(monkeypatch):
     monkeypatch.delenv("OPENAI_USE_RESPONSES_API", raising=False)
     assert config.openai_responses_api_enabled() is True
@@ -332,6 +355,17 @@ def test_runtime_event_logs_enabled_reads_env_truthiness(monkeypatch):
     assert config.runtime_event_logs_enabled() is True
 
 
+def test_install_eager_task_factory_is_opt_in(monkeypatch):
+    async def _task_factory_after_install():
+        cli._install_eager_task_factory()
+        return asyncio.get_running_loop().get_task_factory()
+
+    monkeypatch.delenv("ENABLE_EAGER_TASKS", raising=False)
+    assert asyncio.run(_task_factory_after_install()) is None
+    monkeypatch.setenv("ENABLE_EAGER_TASKS", "true")
+    assert asyncio.run(_task_factory_after_install()) is getattr(asyncio, "eager_task_factory", None)
+
+
 def test_runtime_iteration_knobs_parse_and_default(monkeypatch):
     monkeypatch.delenv("MAX_CONCURRENT_RESEARCH_UNITS", raising=False)
     monkeypatch.delenv("MAX_RESEARCHER_ITERATIONS", raising=False)
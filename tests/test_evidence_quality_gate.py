@@ -139,3 +139,38 @@ def test_final_report_generation_preserves_evidence_ledger_source_transparency()
     assert "Sources:" in result["final_report"]
     assert "https://example.com/a" in result["final_report"]
     assert "No source URLs were available in collected notes." not in result["final_report"]
+
+
+def test_evidence_record_normalizes_source_urls_at_ingest():
+    from deepresearch.state import EvidenceRecord
+
+    record = EvidenceRecord(
+        source_urls=[" https://example.com/a. ", "https://example.com/a", "", "https://example.org/b;"],
+    )
+
+    assert record.source_urls == ["https://example.com/a", "https://example.org/b"]
+
+
+def test_normalize_evidence_ledger_rejects_non_string_source_urls():
+    from deepresearch.state import normalize_evidence_ledger
+
+    assert normalize_evidence_ledger([{"source_urls": [123, {"a": 1}]}]) == []
+    assert normalize_evidence_ledger([{"source_urls": ["https://example.com/a", None]}]) == []
+
+
+def test_normalize_evidence_ledger_validates_only_non_canonical_dicts():
+    from deepresearch.state import EvidenceRecord, normalize_evidence_ledger
+
+    records = normalize_evidence_ledger(
+        [
+            {"source_urls": ["https://example.com/a"], "source_type": "model_cited"},
+            {"source_urls": ["https://example.com/b.", "https://example.com/b"]},
+            {"source_urls": ["https://example.com/c"], "source_type": "invented"},
+            {"source_urls": ["https://example.com/d"], "source_type": ["fetched"]},
+        ]
+    )
+
+    assert records == [
+        EvidenceRecord(source_urls=["https://example.com/a"], source_type="model_cited"),
+        EvidenceRecord(source_urls=["https://example.com/b"], source_type="fetched"),
+    ]
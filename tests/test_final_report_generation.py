@@ -190,6 +190,13 @@ def test_final_report_generation_removes_contradictory_no_sources_line_when_urls
     assert "No source URLs were available in collected notes." not in result["final_report"]
 
 
+def test_remove_internal_meta_lines_splits_on_unicode_line_separators():
+    for separator in ("\r", "\v", "\f", "\x1c", "\x85", "\u2028", "\u2029"):
+        text = f"Intro para{separator}Reflection recorded: internal\n\nBody"
+
+        assert report._remove_internal_meta_lines(text) == "Intro para\n\nBody"
+
+
 def test_final_report_generation_strips_internal_tool_meta_lines(monkeypatch):
     model = _FakeReportModel(
         [
@@ -223,3 +230,79 @@ def test_final_report_generation_strips_internal_tool_meta_lines(monkeypatch):
     assert "ConductResearch" not in result["final_report"]
     assert "search_web" not in result["final_report"]
     assert "Reflection recorded" not in result["final_report"]
+
+
+def test_render_final_report_prompt_is_memoized_per_date():
+    first = report.render_final_report_prompt("2026-02-25")
+    second = report.render_final_report_prompt("2026-02-25")
+
+    assert "2026-02-25" in first
+    assert first is second
+    assert report.render_final_report_prompt("2026-02-26") != first
+
+
+def test_final_report_generation_offloads_large_inputs_without_changing_output(monkeypatch):
+    offloaded: list[str] = []
+
+    async def fake_to_thread(func, *args):
+        offloaded.append(func.__name__)
+        return func(*args)
+
+    monkeypatch.setattr(report.asyncio, "to_thread", fake_to_thread)
+    notes = ["Finding https://example.com/large " + "x" * report._FINALIZE_OFFLOAD_THRESHOLD_CHARS]
+
+    result = asyncio.run(
+        report.final_report_generation(
+            {
+                "research_brief": "Brief",
+                "notes": notes,
+                "raw_notes": [],
+                "final_report": "Report body.",
+            }
+        )
+    )
+
+    assert offloaded == ["_finalize_report_text"]
+    assert result["final_report"] == report._finalize_report_text("Report body.", notes, [], [])
+
+
+def test_synthesis_retry_trims_notes_by_payload_size():
+    notes = ["x" * 900, "short finding", "another short finding"]
+
+    first_retry, _ = report._synthesis_chunks_for_attempt(notes, [], attempt=1)
+    reordered_retry, _ = report._synthesis_chunks_for_attempt(list(reversed(notes)), [], attempt=1)
+
+    assert first_retry == ["x" * 467]
+    assert reordered_retry == ["another short finding", "short finding", "x" * 433]
+    assert report._synthesis_chunks_for_attempt([], [], attempt=2) == ([], [])
+
+
+def test_synthesis_retry_shrinks_single_oversized_note_every_attempt():
+    notes = ["x" * 500_000]
+
+    sizes = [len(report._synthesis_chunks_for_attempt(notes, [], attempt)[0][0]) for attempt in range(3)]
+
+    assert sizes == [500_000, 250_000, 166_666]
+
+
+def test_seed_compressed_notes_passes_small_raw_notes_through():
+    small = report._seed_compressed_notes([], ["Raw finding A", "Raw finding B"])
+    large_block = "y" * report._SEED_COMPRESSION_MIN_CHARS
+    large = report._seed_compressed_notes([], [large_block, large_block])
+
+    assert small == ["Raw finding A\n\nRaw finding B"]
+    assert large == [f"- {large_block}"]
+    assert report._seed_compressed_notes(["kept"], ["ignored"]) == ["kept"]
+
+
+def test_scan_report_sources_finds_urls_and_header_in_one_pass():
+    text = "Body cites https://a.example.com/x.\n\n## References\n- https://b.example.com\n- https://a.example.com/x"
+
+    urls, has_section = report._scan_report_sources(text)
+
+    assert urls == ["https://a.example.com/x", "https://b.example.com"]
+    assert has_section is True
+    assert report._scan_report_sources("Sourced from https://c.example.com today.") == (
+        ["https://c.example.com"],
+        False,
+    )
@@ -21,6 +21,7 @@ def test_native_subgraph_builders_compile(monkeypatch):
 
     assert hasattr(researcher_subgraph, "ainvoke")
     assert hasattr(supervisor_subgraph, "ainvoke")
+    assert graph.build_supervisor_subgraph() is supervisor_subgraph
 
 
 def test_main_graph_routes_through_supervisor_and_final_report_nodes():
@@ -569,7 +569,7 @@ def test_scope_intake_initializes_supervisor_state(monkeypatch):
 def test_supervisor_prepare_runs_parallel_dispatch_planning_and_enforces_cap(monkeypatch):
     supervisor_subgraph = importlib.import_module("deepresearch.supervisor_subgraph")
     monkeypatch.setattr(supervisor_subgraph, "get_max_concurrent_research_units", lambda: 1)
-    monkeypatch.setattr(supervisor_subgraph, "get_max_researcher_iterations", lambda: 3)
+    monkeypatch.setattr(supervisor_subgraph, "get_max_researcher_iterations", lambda: 1)
 
     latest_ai = AIMessage(
         content="",
@@ -623,6 +623,9 @@ def test_supervisor_run_research_unit_extracts_notes_and_evidence(monkeypatch):
     assert any("finding [1]" in note for note in result["notes"])
     assert result["evidence_ledger"]
     assert researcher_graph.ainvoke.await_count == 1
+    seed_message = researcher_graph.ainvoke.await_args.args[0]["messages"][0]
+    assert seed_message.type == "human"
+    assert seed_message.content == "Topic A"
 
 
 def test_supervisor_finalize_marks_completion_when_research_complete_called(monkeypatch):
@@ -768,3 +771,19 @@ def test_research_handoff_update_resets_accumulated_supervisor_and_note_state():
     assert result["raw_notes"] == []
     assert len(result["supervisor_messages"]) == 1
     assert result["supervisor_messages"][0].type == "human"
+
+
+def test_latest_human_texts_reads_only_recent_non_empty_turns():
+    from deepresearch.state import _latest_human_texts
+
+    messages = [
+        HumanMessage(content="first question"),
+        AIMessage(content="answer"),
+        HumanMessage(content="second question"),
+        HumanMessage(content="   "),
+        AIMessage(content="another answer"),
+        HumanMessage(content="third question"),
+    ]
+
+    assert _latest_human_texts(messages, 2) == ["second question", "third question"]
+    assert _latest_human_texts(messages[:1], 2) == ["first question"]
@@ -71,6 +71,30 @@ def test_search_preprocessing_surfaces_provider_error_dict():
     assert output == "Search failed for 'test error': provider request failed after 1 attempt."
 
 
+def test_search_tool_caps_in_flight_provider_calls():
+    in_flight = 0
+    peak = 0
+
+    class SlowSearchTool:
+        async def ainvoke(self, args, config=None):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return "provider output"
+
+    search_tool = nodes._build_search_tool_with_processing(base_search_tool=SlowSearchTool())
+    limit = nodes._TOOL_CONCURRENCY_LIMITS["search_web"]
+
+    async def run_all():
+        return await asyncio.gather(*(search_tool.ainvoke({"query": f"query {index}"}) for index in range(limit * 2)))
+
+    outputs = asyncio.run(run_all())
+    assert len(outputs) == limit * 2
+    assert peak == limit
+
+
 def test_search_preprocessing_is_deterministic_and_llm_free():
     class FakeSearchTool:
         async def ainvoke(self, args, config=None):
@@ -249,3 +273,23 @@ def test_fetch_url_truncates_long_content():
 
     assert result.endswith("...[content truncated]")
     assert len(result) < 20100
+
+
+def test_extract_search_snippet_bounds_large_page_bodies():
+    body = "\n\n   " + "word " * 5000
+
+    snippet = nodes._extract_search_snippet({"raw_content": body, "content": "ignored"}, max_chars=20)
+
+    assert snippet == "word word word word"
+    assert nodes._extract_search_snippet({"raw_content": "   ", "text": " fallback "}) == "fallback"
+    assert nodes._extract_search_snippet({}) == "[No content available]"
+
+
+def test_extract_search_snippet_stops_collecting_highlights_past_budget():
+    class _ExplodingHighlight:
+        def __str__(self):
+            raise AssertionError("highlight past the character budget should not be read")
+
+    result = {"highlights": ["  first highlight  ", "second", _ExplodingHighlight()]}
+
+    assert nodes._extract_search_snippet(result, max_chars=21) == "first highlight\nsecon"
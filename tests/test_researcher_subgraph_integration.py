@@ -148,3 +148,71 @@ def test_render_researcher_prompt_includes_tool_contract():
     assert "search_web" in prompt
     assert "fetch_url" in prompt
     assert "think_tool" in prompt
+
+
+def test_render_researcher_prompt_reuses_render_but_tracks_budget(monkeypatch):
+    monkeypatch.setenv("MAX_REACT_TOOL_CALLS", "7")
+    first = researcher_subgraph.render_researcher_prompt(current_date="2026-02-25")
+    second = researcher_subgraph.render_researcher_prompt(current_date="2026-02-25")
+    monkeypatch.setenv("MAX_REACT_TOOL_CALLS", "9")
+    updated = researcher_subgraph.render_researcher_prompt(current_date="2026-02-25")
+
+    assert first is second
+    assert updated != first
+
+
+def test_research_tools_are_reused_until_search_settings_change(monkeypatch):
+    monkeypatch.setenv("SEARCH_PROVIDER", "none")
+    monkeypatch.setenv("OPENAI_API_KEY", "first-key")
+    researcher_subgraph._cached_research_tools.cache_clear()
+
+    first = researcher_subgraph._build_research_tools_and_capabilities()
+    second = researcher_subgraph._build_research_tools_and_capabilities()
+    monkeypatch.setenv("OPENAI_API_KEY", "rotated-key")
+    rotated = researcher_subgraph._build_research_tools_and_capabilities()
+
+    assert [tool.name for tool in first] == ["think_tool", "fetch_url"]
+    assert all(a is b for a, b in zip(first, second, strict=True))
+    assert first is not second
+    assert rotated[1] is not first[1]
+
+
+def test_unvalidated_evidence_records_match_validated_construction():
+    from deepresearch.state import EvidenceRecord
+
+    messages = [
+        ToolMessage(content="URL: https://example.com/a.\n", tool_call_id="call-1", name="search_web"),
+        AIMessage(content="See https://example.com/b, and https://example.com/a"),
+    ]
+
+    _, _, evidence_ledger = extract_research_from_messages({"messages": messages})
+
+    assert evidence_ledger == [
+        EvidenceRecord(source_urls=["https://example.com/a"], source_type="fetched"),
+        EvidenceRecord(source_urls=["https://example.com/b"], source_type="model_cited"),
+    ]
+    assert [record.model_dump() for record in evidence_ledger] == [
+        {"source_urls": ["https://example.com/a"], "source_type": "fetched"},
+        {"source_urls": ["https://example.com/b"], "source_type": "model_cited"},
+    ]
+
+
+def test_build_researcher_subgraph_reuses_agent_until_inputs_change(monkeypatch):
+    monkeypatch.setenv("SEARCH_PROVIDER", "none")
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    created = []
+
+    def _fake_create_deep_agent(**kwargs):
+        created.append(kwargs)
+        return object()
+
+    monkeypatch.setattr(researcher_subgraph, "create_deep_agent", _fake_create_deep_agent)
+
+    first = researcher_subgraph.build_researcher_subgraph()
+    second = researcher_subgraph.build_researcher_subgraph()
+    monkeypatch.setenv("MAX_REACT_TOOL_CALLS", "3")
+    third = researcher_subgraph.build_researcher_subgraph()
+
+    assert first is second
+    assert third is not first
+    assert len(created) == 2
@@ -5,7 +5,12 @@ from langchain_core.messages import AIMessage
 from langgraph.types import Send
 
 from deepresearch import supervisor_subgraph
-from deepresearch.state import FALLBACK_SUPERVISOR_NO_USEFUL_RESEARCH, today_utc_date
+from deepresearch.state import (
+    FALLBACK_SUPERVISOR_NO_USEFUL_RESEARCH,
+    has_note_text,
+    normalize_note_list,
+    today_utc_date,
+)
 
 TEST_DATE = today_utc_date()
 
@@ -185,3 +190,200 @@ def test_supervisor_finalize_progress_counts_only_fetched_evidence(monkeypatch):
     assert payload["source_domains"] == ["example.com"]
     assert payload["model_cited_record_count"] == 1
     assert payload["model_cited_domains"] == ["example.org"]
+
+
+def test_run_think_calls_records_reflections_inline_in_call_order():
+    think_calls = [
+        {"id": "think-a", "name": "think_tool", "args": {"reflection": "first gap"}},
+        {"id": "think-b", "name": "think_tool", "args": {"reflection": "second gap"}},
+    ]
+
+    messages = supervisor_subgraph._run_think_calls(think_calls)
+
+    assert [message.tool_call_id for message in messages] == ["think-a", "think-b"]
+    assert "first gap" in messages[0].content
+    assert "second gap" in messages[1].content
+
+
+def test_supervisor_messages_pass_through_without_reconversion():
+    existing = AIMessage(content="planning")
+    state_messages = [existing]
+    already_converted = supervisor_subgraph.coerce_messages(state_messages)
+    converted = supervisor_subgraph.coerce_messages([{"role": "assistant", "content": "planning"}])
+
+    assert already_converted is state_messages
+    assert already_converted[0] is existing
+    assert converted[0].type == "ai"
+    assert supervisor_subgraph.coerce_messages(None) == []
+
+
+def test_latest_ai_with_tool_calls_reads_only_newest_ai_message():
+    state = {
+        "supervisor_messages": [
+            {"role": "user", "content": "brief"},
+            AIMessage(
+                content="",
+                tool_calls=[{"id": "call-1", "name": "ResearchComplete", "args": {}}],
+            ),
+            {"role": "tool", "content": "done", "tool_call_id": "call-1"},
+        ]
+    }
+
+    latest_ai = supervisor_subgraph._latest_ai_with_tool_calls(state)
+
+    assert [call["id"] for call in latest_ai.tool_calls] == ["call-1"]
+    assert supervisor_subgraph._latest_ai_with_tool_calls({"supervisor_messages": []}) is None
+    assert supervisor_subgraph.supervisor_route(state) == "supervisor_prepare"
+    assert supervisor_subgraph.supervisor_route({"supervisor_messages": [AIMessage(content="done")]}) == (
+        "supervisor_terminal"
+    )
+
+
+def test_bind_supervisor_tools_reuses_binding_for_same_model():
+    class CountingModel:
+        def __init__(self):
+            self.bind_calls = 0
+
+        def bind_tools(self, tools):
+            self.bind_calls += 1
+            return ("bound", tuple(tool if isinstance(tool, type) else tool.name for tool in tools))
+
+    model = CountingModel()
+    first = supervisor_subgraph._bind_supervisor_tools(model)
+    second = supervisor_subgraph._bind_supervisor_tools(model)
+    other = CountingModel()
+    supervisor_subgraph._bind_supervisor_tools(other)
+
+    assert first is second
+    assert model.bind_calls == 1
+    assert other.bind_calls == 1
+
+
+def test_runnable_supports_config_reuses_signature_per_function(monkeypatch):
+    from deepresearch import runtime_utils
+
+    class _WithConfig:
+        async def ainvoke(self, payload, config=None):
+            return payload
+
+    class _WithoutConfig:
+        async def ainvoke(self, payload):
+            return payload
+
+    runtime_utils._signature_accepts_config.cache_clear()
+    signature_calls = []
+    real_signature = runtime_utils.inspect.signature
+
+    def _counting_signature(target):
+        signature_calls.append(target)
+        return real_signature(target)
+
+    monkeypatch.setattr(runtime_utils.inspect, "signature", _counting_signature)
+
+    assert runtime_utils.runnable_supports_config(_WithConfig().ainvoke) is True
+    assert runtime_utils.runnable_supports_config(_WithConfig().ainvoke) is True
+    assert runtime_utils.runnable_supports_config(_WithoutConfig().ainvoke) is False
+    assert signature_calls == [_WithConfig.ainvoke, _WithoutConfig.ainvoke]
+
+
+def test_render_supervisor_prompt_reuses_render_but_tracks_caps(monkeypatch):
+    supervisor_subgraph._render_supervisor_prompt_cached.cache_clear()
+    monkeypatch.setenv("MAX_CONCURRENT_RESEARCH_UNITS", "2")
+
+    first = supervisor_subgraph.render_supervisor_prompt(current_date=TEST_DATE)
+    second = supervisor_subgraph.render_supervisor_prompt(current_date=TEST_DATE)
+    monkeypatch.setenv("MAX_CONCURRENT_RESEARCH_UNITS", "5")
+    third = supervisor_subgraph.render_supervisor_prompt(current_date=TEST_DATE)
+
+    assert first is second
+    assert third != first
+    assert supervisor_subgraph._render_supervisor_prompt_cached.cache_info().misses == 2
+
+
+def test_research_units_queue_on_concurrency_cap_instead_of_being_skipped(monkeypatch):
+    in_flight = 0
+    peak = 0
+
+    class _SlowResearcher:
+        async def ainvoke(self, payload):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.05)
+            in_flight -= 1
+            return {"messages": [AIMessage(content="finding")]}
+
+    monkeypatch.setattr(supervisor_subgraph, "get_max_concurrent_research_units", lambda: 2)
+    monkeypatch.setattr(supervisor_subgraph, "get_max_researcher_iterations", lambda: 6)
+    monkeypatch.setattr(supervisor_subgraph, "build_researcher_subgraph", lambda: _SlowResearcher())
+
+    assert supervisor_subgraph.compute_research_dispatch_counts(
+        requested_research_units=5,
+        research_iterations=0,
+    ) == (5, 6)
+
+    async def _run_units():
+        return await asyncio.gather(
+            *(
+                supervisor_subgraph.run_research_unit({"research_call": {"id": f"call-{index}", "topic": f"T{index}"}})
+                for index in range(5)
+            )
+        )
+
+    results = asyncio.run(_run_units())
+
+    assert peak == 2
+    summaries = [result["research_unit_summaries"][0] for result in results]
+    assert all(summary["status"] != "failed" for summary in summaries)
+    # The last unit queues for two full rounds; its duration must cover only its own run.
+    assert max(summary["duration_seconds"] for summary in summaries) < 0.1
+
+
+def test_supervisor_reuses_system_message_across_planning_turns(monkeypatch):
+    class _RecordingModel:
+        def __init__(self):
+            self.calls = []
+
+        def bind_tools(self, tools):
+            return self
+
+        async def ainvoke(self, messages):
+            self.calls.append(messages)
+            return AIMessage(content="planning")
+
+    model = _RecordingModel()
+    monkeypatch.setattr(supervisor_subgraph, "get_llm", lambda role: model)
+    state = {"supervisor_messages": [], "research_brief": "Brief"}
+
+    asyncio.run(supervisor_subgraph.supervisor(state))
+    asyncio.run(supervisor_subgraph.supervisor(state))
+
+    assert model.calls[0][0].type == "system"
+    assert model.calls[1][0] is model.calls[0][0]
+
+
+def test_skipped_research_messages_are_independent_copies_of_the_template():
+    messages, summaries = supervisor_subgraph._build_skipped_research_messages(
+        [
+            {"id": "call-1", "args": {"research_topic": "Topic A"}},
+            {"args": {"research_topic": "Topic B"}},
+        ],
+        remaining_iterations=0,
+    )
+
+    assert [message.tool_call_id for message in messages] == ["call-1", "supervisor_research_skipped_1"]
+    assert all(message.type == "tool" and message.name == "ConductResearch" for message in messages)
+    assert all(message.content.startswith("[ConductResearch skipped: reached runtime cap") for message in messages)
+    assert messages[0] is not messages[1]
+    assert supervisor_subgraph._SKIPPED_RESEARCH_TEMPLATE.tool_call_id == ""
+    assert messages[0].additional_kwargs is not messages[1].additional_kwargs
+    assert messages[0].response_metadata is not supervisor_subgraph._SKIPPED_RESEARCH_TEMPLATE.response_metadata
+    messages[0].additional_kwargs["mutated"] = True
+    assert supervisor_subgraph._SKIPPED_RESEARCH_TEMPLATE.additional_kwargs == {}
+    assert [summary["topic"] for summary in summaries] == ["Topic A", "Topic B"]
+
+
+def test_has_note_text_matches_normalized_note_emptiness():
+    values = [None, "", "  ", "note", [], ["", "  ", None], ["", "kept"], 0, 7, {"k": "v"}]
+
+    assert [has_note_text(value) for value in values] == [bool(normalize_note_list(value)) for value in values]